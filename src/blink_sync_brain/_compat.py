@@ -0,0 +1,15 @@
+"""
+Python version compatibility helpers for Blink Sync Brain.
+
+Kept free of third-party imports so that both the settings and the data
+models can use them.
+"""
+
+import sys
+from typing import Any, Dict
+
+# Slotted dataclasses are smaller and faster to read; dataclass slots
+# need Python 3.10+, older interpreters keep a per-instance __dict__
+DATACLASS_OPTIONS: Dict[str, Any] = (
+    {"slots": True} if sys.version_info >= (3, 10) else {}
+)
@@ -6,19 +6,94 @@ system enhancement application.
 """
 
 import os
-from dataclasses import dataclass, field
-from pathlib import Path
-from typing import Optional
+import re
+import sys
+import tempfile
+from dataclasses import dataclass, field, fields, is_dataclass
+from pathlib import Path, PurePath
+from typing import Any, Callable, ClassVar, Dict, Optional, Sequence, Tuple
 
 import yaml
 from dotenv import load_dotenv
 
+from blink_sync_brain._compat import DATACLASS_OPTIONS
 
-@dataclass
+# Prefer the libyaml C implementations when PyYAML was built with them
+try:
+    from yaml import CSafeDumper as _SafeDumper
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeDumper as _SafeDumper
+    from yaml import SafeLoader as _SafeLoader
+
+# ``${VAR}`` references in config files are expanded from the environment
+_ENV_VAR_PATTERN = re.compile(rb"\$\{([A-Za-z_][A-Za-z0-9_]*)\}")
+
+# ``.env`` only needs to be parsed once per process, not on every Settings()
+_DOTENV_LOADED = False
+
+# Config files parsed from disk, keyed by resolved path ->
+# (mtime_ns, ((variable, value) interpolated into it, ...), parsed YAML)
+_SETTINGS_CACHE: Dict[str, Tuple[int, Tuple[Tuple[str, Optional[str]], ...], dict]] = {}
+
+# Process-wide default instance handed out by Settings.get_instance()
+_DEFAULT_SETTINGS: Optional["Settings"] = None
+
+
+# Constants checked by Settings.validate()
+_LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+_VALID_LOG_LEVELS = frozenset(_LOG_LEVELS)
+_LOG_LEVEL_ERROR = f"Log level must be one of: {list(_LOG_LEVELS)}"
+_PORT_RANGE = range(1, 65536)
+
+# Shared by every NotificationSettings that keeps the default types
+_DEFAULT_NOTIFICATION_TYPES = ("unknown_face", "motion_detected", "system_alert")
+
+# Sentinel for keys absent from a config section
+_MISSING = object()
+
+
+def _intern(value: Any) -> Optional[str]:
+    """Intern string settings so repeated loads share one copy, keeping null as None."""
+    return sys.intern(str(value)) if value is not None else None
+
+
+def _optional_path(value: Optional[str]) -> Optional[Path]:
+    """Convert a config value to a Path, keeping null as None."""
+    return Path(value) if value is not None else None
+
+
+def _to_plain(value: Any) -> Any:
+    """Convert a settings dataclass to YAML-safe builtins in a single walk."""
+    if is_dataclass(value):
+        return {
+            f.name: _to_plain(getattr(value, f.name))
+            for f in fields(value)
+            if not f.name.startswith("_")
+        }
+    if isinstance(value, PurePath):
+        return str(value)
+    if isinstance(value, tuple):
+        return list(value)
+    return value
+
+
+def _interpolate_env(raw: bytes) -> bytes:
+    """Expand ``${VAR}`` references, leaving unset variables untouched."""
+    def _replace(match: "re.Match[bytes]") -> bytes:
+        value = os.environ.get(match.group(1).decode())
+        return value.encode() if value is not None else match.group(0)
+
+    return _ENV_VAR_PATTERN.sub(_replace, raw)
+
+
+@dataclass(**DATACLASS_OPTIONS)
 class StorageSettings:
     """Storage configuration settings."""
     virtual_drive_path: Path = Path("/var/blink_storage/virtual_drive.img")
     virtual_drive_size_gb: int = 32
+    zero_fill_virtual_drive: bool = False  # Write zeros instead of preallocating
+    sparse_virtual_drive: bool = False  # Allocate blocks only as they are written
     video_directory: Path = Path("/var/blink_storage/videos")
     results_directory: Path = Path("/var/blink_storage/results")
     cleanup_threshold: float = 80.0  # Percentage
@@ -26,40 +101,45 @@ class StorageSettings:
     monitor_interval: int = 300  # seconds
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class ProcessingSettings:
     """Video processing configuration settings."""
     frame_skip: int = 5  # Process every nth frame
     monitor_interval: int = 60  # seconds
     max_concurrent_videos: int = 2
+    recognition_batch_size: int = 32  # Face encodings recognized per batch
+    motion_gate: bool = True  # Only run face detection where the scene changed
+    hardware_decode: bool = True  # Let FFmpeg decode on the GPU/SoC when available
     processing_timeout: int = 300  # seconds
     enable_face_recognition: bool = True
     enable_video_stitching: bool = True
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class FaceRecognitionSettings:
     """Face recognition configuration settings."""
-    database_path: Path = Path("/var/blink_storage/face_database.pkl")
+    database_path: Path = Path("/var/blink_storage/face_database.npy")
     confidence_threshold: float = 0.6
     tolerance: float = 0.6
     min_face_size: int = 20
     enable_batch_processing: bool = True
+    detection_model: str = "hog"  # "hog" (CPU) or "cnn" (GPU)
+    detection_scale: float = 0.5  # Frames are resized by this factor before detection
+    detection_upsample: int = 1
+    encoding_model: str = "large"  # Landmark model: "large" (68-point) or "small" (5-point)
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class NotificationSettings:
     """Notification configuration settings."""
     enable_notifications: bool = True
-    notification_types: list = field(
-        default_factory=lambda: ["unknown_face", "motion_detected", "system_alert"]
-    )
+    notification_types: Sequence[str] = _DEFAULT_NOTIFICATION_TYPES
     email_enabled: bool = False
     pushbullet_enabled: bool = False
     webhook_enabled: bool = False
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class NetworkSettings:
     """Network configuration settings."""
     host: str = "0.0.0.0"
@@ -69,7 +149,7 @@ class NetworkSettings:
     ssl_key_path: Optional[Path] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class LoggingSettings:
     """Logging configuration settings."""
     level: str = "INFO"
@@ -79,7 +159,7 @@ class LoggingSettings:
     backup_count: int = 5
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class Settings:
     """Main application settings."""
     
@@ -96,52 +176,45 @@ class Settings:
     network: NetworkSettings = field(default_factory=NetworkSettings)
     logging: LoggingSettings = field(default_factory=LoggingSettings)
 
+    # Config file keys per section, compiled from the field types below
+    _SCHEMA: ClassVar[Dict[str, Dict[str, Optional[Callable[[Any], Any]]]]] = {}
+
+    # Last validate() inputs and result
+    _validation_cache: Optional[Tuple[tuple, list]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    # Environment overrides: (variable, section, attribute, type)
+    _ENV_MAP = (
+        ("VIRTUAL_DRIVE_PATH", "storage", "virtual_drive_path", Path),
+        ("VIRTUAL_DRIVE_SIZE_GB", "storage", "virtual_drive_size_gb", int),
+        ("VIDEO_DIRECTORY", "storage", "video_directory", Path),
+        ("FRAME_SKIP", "processing", "frame_skip", int),
+        ("MAX_CONCURRENT_VIDEOS", "processing", "max_concurrent_videos", int),
+        ("FACE_DATABASE_PATH", "face_recognition", "database_path", Path),
+        ("FACE_CONFIDENCE_THRESHOLD", "face_recognition", "confidence_threshold", float),
+        ("HOST", "network", "host", sys.intern),
+        ("PORT", "network", "port", int),
+        ("LOG_LEVEL", "logging", "level", sys.intern),
+        ("LOG_FILE", "logging", "file_path", Path),
+    )
+
     def __post_init__(self):
         """Post-initialization setup."""
-        load_dotenv()
+        global _DOTENV_LOADED
+        if not _DOTENV_LOADED:
+            load_dotenv()
+            _DOTENV_LOADED = True
         self.debug = os.getenv("DEBUG", "false").lower() == "true"
         # Override with environment variables if present
         self._load_from_env()
     
     def _load_from_env(self):
         """Load settings from environment variables."""
-        # Storage settings
-        if os.getenv("VIRTUAL_DRIVE_PATH"):
-            self.storage.virtual_drive_path = Path(os.getenv("VIRTUAL_DRIVE_PATH"))
-        
-        if os.getenv("VIRTUAL_DRIVE_SIZE_GB"):
-            self.storage.virtual_drive_size_gb = int(os.getenv("VIRTUAL_DRIVE_SIZE_GB"))
-        
-        if os.getenv("VIDEO_DIRECTORY"):
-            self.storage.video_directory = Path(os.getenv("VIDEO_DIRECTORY"))
-        
-        # Processing settings
-        if os.getenv("FRAME_SKIP"):
-            self.processing.frame_skip = int(os.getenv("FRAME_SKIP"))
-        
-        if os.getenv("MAX_CONCURRENT_VIDEOS"):
-            self.processing.max_concurrent_videos = int(os.getenv("MAX_CONCURRENT_VIDEOS"))
-        
-        # Face recognition settings
-        if os.getenv("FACE_DATABASE_PATH"):
-            self.face_recognition.database_path = Path(os.getenv("FACE_DATABASE_PATH"))
-        
-        if os.getenv("FACE_CONFIDENCE_THRESHOLD"):
-            self.face_recognition.confidence_threshold = float(os.getenv("FACE_CONFIDENCE_THRESHOLD"))
-        
-        # Network settings
-        if os.getenv("HOST"):
-            self.network.host = os.getenv("HOST")
-        
-        if os.getenv("PORT"):
-            self.network.port = int(os.getenv("PORT"))
-        
-        # Logging settings
-        if os.getenv("LOG_LEVEL"):
-            self.logging.level = os.getenv("LOG_LEVEL")
-        
-        if os.getenv("LOG_FILE"):
-            self.logging.file_path = Path(os.getenv("LOG_FILE"))
+        env = os.environ
+        for key, section, attr, cast in self._ENV_MAP:
+            if value := env.get(key):
+                setattr(getattr(self, section), attr, cast(value))
     
     @classmethod
     def from_file(cls, config_path: Path) -> "Settings":
@@ -154,13 +227,37 @@ class Settings:
         Returns:
             Settings instance
         """
-        if not config_path.exists():
-            raise FileNotFoundError(f"Configuration file not found: {config_path}")
-        
-        with open(config_path, "r") as f:
-            config_data = yaml.safe_load(f)
+        try:
+            mtime_ns = config_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Configuration file not found: {config_path}") from None
+        
+        # Reuse the previous parse while neither the file nor a variable it
+        # references has changed
+        cache_key = str(config_path.resolve())
+        cached = _SETTINGS_CACHE.get(cache_key)
+        if (
+            cached is not None
+            and cached[0] == mtime_ns
+            and all(os.environ.get(name) == value for name, value in cached[1])
+        ):
+            config_data = cached[2]
+        else:
+            with open(config_path, "rb") as f:
+                raw = f.read()
+            
+            # Only pay for interpolation when the file actually references a variable
+            env_refs: Tuple[Tuple[str, Optional[str]], ...] = ()
+            if b"${" in raw:
+                names = sorted({name.decode() for name in _ENV_VAR_PATTERN.findall(raw)})
+                env_refs = tuple((name, os.environ.get(name)) for name in names)
+                raw = _interpolate_env(raw)
+            
+            config_data = yaml.load(raw, Loader=_SafeLoader) or {}
+            _SETTINGS_CACHE[cache_key] = (mtime_ns, env_refs, config_data)
         
-        # Create settings instance
+        # A fresh instance every call: callers may mutate it, and env
+        # overrides are read again by __post_init__
         settings = cls()
         
         # Update settings from config file
@@ -168,126 +265,40 @@ class Settings:
         
         return settings
     
-    def _update_from_dict(self, config_data: dict):
-        """Update settings from a dictionary."""
-        # Storage settings
-        if "storage" in config_data:
-            storage_data = config_data["storage"]
-            if "virtual_drive_path" in storage_data:
-                self.storage.virtual_drive_path = Path(storage_data["virtual_drive_path"])
-            if "virtual_drive_size_gb" in storage_data:
-                self.storage.virtual_drive_size_gb = storage_data["virtual_drive_size_gb"]
-            if "video_directory" in storage_data:
-                self.storage.video_directory = Path(storage_data["video_directory"])
-            if "cleanup_threshold" in storage_data:
-                self.storage.cleanup_threshold = storage_data["cleanup_threshold"]
-            if "retention_days" in storage_data:
-                self.storage.retention_days = storage_data["retention_days"]
-        
-        # Processing settings
-        if "processing" in config_data:
-            processing_data = config_data["processing"]
-            if "frame_skip" in processing_data:
-                self.processing.frame_skip = processing_data["frame_skip"]
-            if "max_concurrent_videos" in processing_data:
-                self.processing.max_concurrent_videos = processing_data["max_concurrent_videos"]
-            if "enable_face_recognition" in processing_data:
-                self.processing.enable_face_recognition = processing_data["enable_face_recognition"]
-            if "enable_video_stitching" in processing_data:
-                self.processing.enable_video_stitching = processing_data["enable_video_stitching"]
-        
-        # Face recognition settings
-        if "face_recognition" in config_data:
-            face_data = config_data["face_recognition"]
-            if "database_path" in face_data:
-                self.face_recognition.database_path = Path(face_data["database_path"])
-            if "confidence_threshold" in face_data:
-                self.face_recognition.confidence_threshold = face_data["confidence_threshold"]
-            if "tolerance" in face_data:
-                self.face_recognition.tolerance = face_data["tolerance"]
-        
-        # Notification settings
-        if "notifications" in config_data:
-            notif_data = config_data["notifications"]
-            if "enable_notifications" in notif_data:
-                self.notifications.enable_notifications = notif_data["enable_notifications"]
-            if "notification_types" in notif_data:
-                self.notifications.notification_types = notif_data["notification_types"]
-            if "email_enabled" in notif_data:
-                self.notifications.email_enabled = notif_data["email_enabled"]
-            if "pushbullet_enabled" in notif_data:
-                self.notifications.pushbullet_enabled = notif_data["pushbullet_enabled"]
+    @classmethod
+    def get_instance(cls, config_path: Optional[Path] = None) -> "Settings":
+        """
+        Get shared settings for this process.
         
-        # Network settings
-        if "network" in config_data:
-            network_data = config_data["network"]
-            if "host" in network_data:
-                self.network.host = network_data["host"]
-            if "port" in network_data:
-                self.network.port = network_data["port"]
-            if "enable_ssl" in network_data:
-                self.network.enable_ssl = network_data["enable_ssl"]
+        Args:
+            config_path: Optional configuration file to load instead of defaults
+            
+        Returns:
+            Settings loaded from config_path, or the process-wide default
+        """
+        if config_path is not None:
+            return cls.from_file(config_path)
         
-        # Logging settings
-        if "logging" in config_data:
-            logging_data = config_data["logging"]
-            if "level" in logging_data:
-                self.logging.level = logging_data["level"]
-            if "file_path" in logging_data:
-                self.logging.file_path = Path(logging_data["file_path"])
+        global _DEFAULT_SETTINGS
+        if _DEFAULT_SETTINGS is None:
+            _DEFAULT_SETTINGS = cls()
+        return _DEFAULT_SETTINGS
+    
+    def _update_from_dict(self, config_data: dict):
+        """Update settings from a dictionary."""
+        for section, schema in self._SCHEMA.items():
+            section_data = config_data.get(section)
+            if not section_data:
+                continue
+            target = getattr(self, section)
+            for name, cast in schema.items():
+                value = section_data.get(name, _MISSING)
+                if value is not _MISSING:
+                    setattr(target, name, cast(value) if cast else value)
     
     def to_dict(self) -> dict:
         """Convert settings to dictionary."""
-        return {
-            "app_name": self.app_name,
-            "version": self.version,
-            "debug": self.debug,
-            "storage": {
-                "virtual_drive_path": str(self.storage.virtual_drive_path),
-                "virtual_drive_size_gb": self.storage.virtual_drive_size_gb,
-                "video_directory": str(self.storage.video_directory),
-                "results_directory": str(self.storage.results_directory),
-                "cleanup_threshold": self.storage.cleanup_threshold,
-                "retention_days": self.storage.retention_days,
-                "monitor_interval": self.storage.monitor_interval,
-            },
-            "processing": {
-                "frame_skip": self.processing.frame_skip,
-                "monitor_interval": self.processing.monitor_interval,
-                "max_concurrent_videos": self.processing.max_concurrent_videos,
-                "processing_timeout": self.processing.processing_timeout,
-                "enable_face_recognition": self.processing.enable_face_recognition,
-                "enable_video_stitching": self.processing.enable_video_stitching,
-            },
-            "face_recognition": {
-                "database_path": str(self.face_recognition.database_path),
-                "confidence_threshold": self.face_recognition.confidence_threshold,
-                "tolerance": self.face_recognition.tolerance,
-                "min_face_size": self.face_recognition.min_face_size,
-                "enable_batch_processing": self.face_recognition.enable_batch_processing,
-            },
-            "notifications": {
-                "enable_notifications": self.notifications.enable_notifications,
-                "notification_types": self.notifications.notification_types,
-                "email_enabled": self.notifications.email_enabled,
-                "pushbullet_enabled": self.notifications.pushbullet_enabled,
-                "webhook_enabled": self.notifications.webhook_enabled,
-            },
-            "network": {
-                "host": self.network.host,
-                "port": self.network.port,
-                "enable_ssl": self.network.enable_ssl,
-                "ssl_cert_path": str(self.network.ssl_cert_path) if self.network.ssl_cert_path else None,
-                "ssl_key_path": str(self.network.ssl_key_path) if self.network.ssl_key_path else None,
-            },
-            "logging": {
-                "level": self.logging.level,
-                "format": self.logging.format,
-                "file_path": str(self.logging.file_path) if self.logging.file_path else None,
-                "max_size_mb": self.logging.max_size_mb,
-                "backup_count": self.logging.backup_count,
-            },
-        }
+        return _to_plain(self)
     
     def save_to_file(self, config_path: Path) -> None:
         """
@@ -296,13 +307,42 @@ class Settings:
         Args:
             config_path: Path to save the configuration file
         """
-        config_data = self.to_dict()
+        data = yaml.dump(
+            self.to_dict(),
+            Dumper=_SafeDumper,
+            default_flow_style=False,
+            indent=2,
+            sort_keys=False,
+            encoding="utf-8",
+        )
+        
+        # Skip the SD card write when the file already holds this content
+        try:
+            if config_path.read_bytes() == data:
+                return
+        except OSError:
+            pass
         
         # Create directory if it doesn't exist
         config_path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(config_path, "w") as f:
-            yaml.dump(config_data, f, default_flow_style=False, indent=2)
+        # Write to a sibling temp file and rename so readers never see a partial file
+        fd, tmp_path = tempfile.mkstemp(
+            dir=config_path.parent, prefix=f".{config_path.name}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            # mkstemp creates 0600 files; keep the config readable as before
+            try:
+                mode = config_path.stat().st_mode & 0o777
+            except FileNotFoundError:
+                mode = 0o644
+            os.chmod(tmp_path, mode)
+            os.replace(tmp_path, config_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
     
     def validate(self) -> list:
         """
@@ -313,31 +353,73 @@ class Settings:
         """
         errors = []
         
-        # Check storage paths
-        if not self.storage.virtual_drive_path.parent.exists():
-            errors.append(f"Virtual drive directory does not exist: {self.storage.virtual_drive_path.parent}")
+        # Check storage paths; the directory can come and go, so never cached
+        drive_dir = self.storage.virtual_drive_path.parent
+        if not os.path.isdir(drive_dir):
+            errors.append(f"Virtual drive directory does not exist: {drive_dir}")
+        
+        # Sub-settings are mutated in place, so key the cache on the inputs
+        key = (
+            self.processing.frame_skip,
+            self.processing.max_concurrent_videos,
+            self.face_recognition.confidence_threshold,
+            self.face_recognition.tolerance,
+            self.face_recognition.detection_scale,
+            self.network.port,
+            self.logging.level,
+        )
+        if self._validation_cache is not None and self._validation_cache[0] == key:
+            return errors + self._validation_cache[1]
+        
+        value_errors = []
         
         # Check processing settings
         if self.processing.frame_skip < 1:
-            errors.append("Frame skip must be at least 1")
+            value_errors.append("Frame skip must be at least 1")
         
         if self.processing.max_concurrent_videos < 1:
-            errors.append("Max concurrent videos must be at least 1")
+            value_errors.append("Max concurrent videos must be at least 1")
         
         # Check face recognition settings
         if not (0.0 <= self.face_recognition.confidence_threshold <= 1.0):
-            errors.append("Face confidence threshold must be between 0.0 and 1.0")
+            value_errors.append("Face confidence threshold must be between 0.0 and 1.0")
         
         if not (0.0 <= self.face_recognition.tolerance <= 1.0):
-            errors.append("Face tolerance must be between 0.0 and 1.0")
+            value_errors.append("Face tolerance must be between 0.0 and 1.0")
+        
+        if not (0.0 < self.face_recognition.detection_scale <= 1.0):
+            value_errors.append("Face detection scale must be greater than 0.0 and at most 1.0")
         
         # Check network settings
-        if not (1 <= self.network.port <= 65535):
-            errors.append("Port must be between 1 and 65535")
+        if self.network.port not in _PORT_RANGE:
+            value_errors.append("Port must be between 1 and 65535")
         
         # Check logging settings
-        valid_log_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-        if self.logging.level not in valid_log_levels:
-            errors.append(f"Log level must be one of: {valid_log_levels}")
+        if self.logging.level not in _VALID_LOG_LEVELS:
+            value_errors.append(_LOG_LEVEL_ERROR)
         
-        return errors 
\ No newline at end of file
+        self._validation_cache = (key, value_errors)
+        return errors + value_errors
+
+
+def _field_coercer(field_type: Any) -> Optional[Callable[[Any], Any]]:
+    """Pick the coercion applied to a config value for a field's type."""
+    if field_type is Path:
+        return Path
+    if field_type == Optional[Path]:
+        return _optional_path
+    if field_type is str:
+        return _intern
+    if field_type in (int, float):
+        return field_type
+    if field_type == Sequence[str]:
+        return tuple
+    # Booleans and anything else are taken from YAML as-is
+    return None
+
+
+Settings._SCHEMA = {
+    section.name: {f.name: _field_coercer(f.type) for f in fields(section.type)}
+    for section in fields(Settings)
+    if is_dataclass(section.type)
+}
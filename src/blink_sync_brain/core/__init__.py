@@ -3,16 +3,47 @@ Core components for Blink Sync Brain system.
 
 This package contains the main business logic components for the
 Blink camera system enhancement.
+
+Components are resolved lazily on first attribute access (PEP 562), so
+importing one submodule (e.g. ``core.usb_gadget`` on the Drive Pi) does not
+pull in OpenCV, dlib and the rest of the Processor stack.
 """
 
-from .usb_gadget import USBGadgetManager
-from .video_processor import VideoProcessor
-from .face_recognition import FaceRecognitionEngine
-from .storage_manager import StorageManager
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .face_recognition import FaceRecognitionEngine
+    from .storage_manager import StorageManager
+    from .usb_gadget import USBGadgetManager
+    from .video_processor import VideoProcessor
+
+_LAZY_IMPORTS = {
+    "USBGadgetManager": ".usb_gadget",
+    "VideoProcessor": ".video_processor",
+    "FaceRecognitionEngine": ".face_recognition",
+    "StorageManager": ".storage_manager",
+}
 
 __all__ = [
     "USBGadgetManager",
     "VideoProcessor",
     "FaceRecognitionEngine",
     "StorageManager",
-] 
\ No newline at end of file
+]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a core component the first time it is accessed."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """Include lazily imported components in ``dir()``."""
+    return sorted(set(globals()) | set(__all__))
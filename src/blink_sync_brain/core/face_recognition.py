@@ -5,22 +5,157 @@ This module provides face detection and recognition capabilities for
 the Blink camera system enhancement.
 """
 
+from __future__ import annotations
+
 import asyncio
 import json
 import logging
+import os
 import pickle
+import threading
+from collections import Counter, defaultdict
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Any, BinaryIO, Callable, Dict, Iterator, List, Optional, Tuple
 
-import cv2
-import face_recognition
-import numpy as np
 import structlog
-from PIL import Image
 
+from blink_sync_brain.config.settings import FaceRecognitionSettings
 from blink_sync_brain.models.face_data import FaceData, KnownFace
 
+# Part of the processor extra; annotations are lazy, so only the methods need it
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import simsimd
+except ImportError:
+    simsimd = None
+
+# Length of the face_recognition (dlib ResNet) encoding vector
+_ENCODING_DIM = 128
+
+# Used when the engine is constructed without Settings
+_DEFAULT_FACE_SETTINGS = FaceRecognitionSettings()
+
+# On-disk layout version written to the JSON sidecar
+_DATABASE_VERSION = 1
+
+# Suffix of the single-pickle database format used by older versions
+_LEGACY_SUFFIX = ".pkl"
+
+# Images loaded and detected together when enrolling known faces
+_ENROLL_BATCH_SIZE = 32
+
+# File types picked up by batch_process_images
+_IMAGE_EXTS = frozenset({".jpg", ".jpeg", ".png", ".bmp", ".tiff"})
+
+
+@lru_cache(maxsize=1)
+def _dlib_uses_cuda() -> bool:
+    """Check whether dlib was built with CUDA support."""
+    try:
+        import dlib
+        return bool(getattr(dlib, "DLIB_USE_CUDA", False))
+    except ImportError:
+        return False
+
+
+def _iter_image_files(directory: str) -> Iterator[str]:
+    """Yield paths of image files under directory, recursively."""
+    pending = [directory]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif os.path.splitext(entry.name)[1].lower() in _IMAGE_EXTS and entry.is_file():
+                    yield entry.path
+
+
+def _atomic_write(path: Path, write: Callable[[BinaryIO], Any]) -> None:
+    """Write a file via a temp file and rename, so readers never see it partial."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            write(f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _dump_metadata(metadata: Dict[str, Any]) -> bytes:
+    """Serialize the sidecar metadata, with orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(metadata)
+    return json.dumps(metadata, separators=(",", ":")).encode("utf-8")
+
+
+def _load_metadata(raw: bytes) -> Dict[str, Any]:
+    """Parse sidecar metadata written by _dump_metadata."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+@lru_cache(maxsize=1)
+def _argmin_l2_kernel() -> Optional[Callable[[Any, Any], Tuple[int, float]]]:
+    """
+    Compile the numba nearest-row kernel on first use.
+    
+    Importing numba and compiling the kernel takes about a second, so it is
+    paid once load_face_database has loaded a database (see
+    _warm_up_argmin_l2), not by every import of this module.
+    
+    Returns:
+        The kernel, or None when numba is not installed
+    """
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+    
+    @njit(
+        "Tuple((int64, float32))(float32[:, ::1], float32[::1])",
+        cache=True,
+        fastmath=True,
+        boundscheck=False,
+    )
+    def _argmin_l2(matrix, query):
+        """Index and squared L2 distance of the row nearest to query."""
+        best_index = 0
+        best_distance_sq = np.float32(np.inf)
+        for i in range(matrix.shape[0]):
+            acc = np.float32(0.0)
+            for k in range(_ENCODING_DIM):
+                diff = matrix[i, k] - query[k]
+                acc += diff * diff
+            if acc < best_distance_sq:
+                best_distance_sq = acc
+                best_index = i
+        return best_index, best_distance_sq
+    
+    return _argmin_l2
+
+
+def _warm_up_argmin_l2() -> None:
+    """Compile (or load from numba's cache) the kernel with a dummy match."""
+    argmin_l2 = _argmin_l2_kernel()
+    if argmin_l2 is not None:
+        argmin_l2(
+            np.zeros((1, _ENCODING_DIM), dtype=np.float32),
+            np.zeros(_ENCODING_DIM, dtype=np.float32),
+        )
+
 
 class FaceRecognitionEngine:
     """
@@ -32,14 +167,38 @@ class FaceRecognitionEngine:
     
     def __init__(self, settings=None):
         """Initialize the Face Recognition Engine."""
+        if np is None:
+            raise ImportError(
+                "FaceRecognitionEngine needs numpy; install the processor extra "
+                "(pip install .[processor])"
+            )
         self.settings = settings
         self.logger = structlog.get_logger()
         self.known_faces: List[KnownFace] = []
-        self.face_encodings: List[np.ndarray] = []
         self.face_names: List[str] = []
+        # Contiguous (N, 128) float32 copy of face_encodings used for matching
+        self._enc_matrix: np.ndarray = np.empty((0, _ENCODING_DIM), dtype=np.float32)
+        # Squared row norms of _enc_matrix, computed on first use
+        self._enc_sqnorms: Optional[np.ndarray] = None
+        # Set when known_faces changed; the matrix is rebuilt on next use
+        # so a run of deferred adds pays for one rebuild
+        self._matrix_stale = False
         self.model_path: Optional[Path] = None
         self.is_loaded = False
+        # True when the in-memory database has changes not yet saved
+        self._dirty = False
+        # Kept up to date on every change so get_face_statistics is O(1)
+        self._name_counts: Counter = Counter()
+        self._latest_added: Optional[float] = None
+        self._db_size_mb = 0.0
+        # Per-thread RGB output buffer reused by convert_frame
+        self._frame_buffers = threading.local()
         
+    @property
+    def face_encodings(self) -> List[np.ndarray]:
+        """Encodings of known_faces, in order; rows of the mapped file after a load."""
+        return [face.encoding for face in self.known_faces]
+    
     async def load_face_database(self, database_path: Optional[Path] = None) -> bool:
         """
         Load the face recognition database.
@@ -54,41 +213,68 @@ class FaceRecognitionEngine:
             if database_path is None:
                 database_path = self.settings.face_recognition.database_path
             
-            self.model_path = Path(database_path)
-            
-            if not self.model_path.exists():
+            database_path = Path(database_path)
+            # Databases used to be a single pickle; those are migrated on load
+            if database_path.suffix == _LEGACY_SUFFIX:
+                legacy_path = database_path
+                self.model_path = database_path.with_suffix(".npy")
+            else:
+                legacy_path = database_path.with_suffix(_LEGACY_SUFFIX)
+                self.model_path = database_path
+            
+            if self.model_path.exists():
+                self.logger.info("Loading face database", path=str(self.model_path))
+                self._load_arrays()
+                self._dirty = False
+                self._db_size_mb = self._get_database_size()
+            elif legacy_path.exists():
+                self.logger.info(
+                    "Migrating legacy face database",
+                    path=str(legacy_path),
+                    new_path=str(self.model_path),
+                )
+                self._load_legacy_pickle(legacy_path)
+                self._dirty = True
+            else:
                 self.logger.warning("Face database not found, creating new one", path=str(self.model_path))
                 await self._create_new_database()
+                await self._warm_up_matcher()
                 return True
             
-            self.logger.info("Loading face database", path=str(self.model_path))
-            
-            # Load the face database
-            with open(self.model_path, "rb") as f:
-                data = pickle.load(f)
-                
-            self.known_faces = data.get("known_faces", [])
-            self.face_encodings = data.get("encodings", [])
-            self.face_names = data.get("names", [])
-            
             self.is_loaded = True
             
             self.logger.info(
                 "Face database loaded successfully",
                 known_faces=len(self.known_faces),
-                encodings=len(self.face_encodings),
+                encodings=len(self._enc_matrix),
             )
             
+            if self._dirty:
+                await self.save_face_database()
+            
+            await self._warm_up_matcher()
             return True
             
         except Exception as e:
             self.logger.error("Failed to load face database", error=str(e))
             return False
     
+    async def _warm_up_matcher(self) -> None:
+        """Compile the numba kernel now, so the first frame does not wait for it."""
+        try:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, _warm_up_argmin_l2)
+        except Exception as e:
+            # recognize_face falls back to simsimd or BLAS without it
+            self.logger.warning("Failed to compile face matching kernel", error=str(e))
+    
     async def save_face_database(self) -> bool:
         """
         Save the face recognition database.
         
+        Encodings are written as one float32 .npy matrix and the remaining
+        KnownFace fields to a JSON sidecar next to it.
+        
         Returns:
             bool: True if saved successfully, False otherwise
         """
@@ -96,23 +282,30 @@ class FaceRecognitionEngine:
             if not self.model_path:
                 raise RuntimeError("No database path specified")
             
+            if not self._dirty:
+                self.logger.debug("Face database unchanged, skipping save")
+                return True
+            
             self.logger.info("Saving face database", path=str(self.model_path))
             
             # Create directory if it doesn't exist
             self.model_path.parent.mkdir(parents=True, exist_ok=True)
             
-            # Prepare data for saving
-            data = {
-                "known_faces": self.known_faces,
-                "encodings": self.face_encodings,
-                "names": self.face_names,
-                "last_updated": datetime.now(),
+            # Prepare metadata for saving
+            metadata = {
+                "version": _DATABASE_VERSION,
+                "last_updated": datetime.now().isoformat(),
+                "known_faces": [face.to_dict(include_encoding=False) for face in self.known_faces],
             }
             
-            # Save to file
-            with open(self.model_path, "wb") as f:
-                pickle.dump(data, f)
+            # The loaded matrix may be memory-mapped from model_path, so it
+            # must never be truncated in place
+            self._ensure_encoding_matrix()
+            _atomic_write(self.model_path, lambda f: np.save(f, self._enc_matrix))
+            _atomic_write(self._metadata_path(), lambda f: f.write(_dump_metadata(metadata)))
             
+            self._dirty = False
+            self._db_size_mb = self._get_database_size()
             self.logger.info("Face database saved successfully")
             return True
             
@@ -126,6 +319,8 @@ class FaceRecognitionEngine:
         image_path: Path,
         description: str = "",
         confidence_threshold: float = 0.6,
+        defer_save: bool = False,
+        face_location: Optional[Tuple[int, int, int, int]] = None,
     ) -> bool:
         """
         Add a new known face to the database.
@@ -135,6 +330,9 @@ class FaceRecognitionEngine:
             image_path: Path to the face image
             description: Optional description
             confidence_threshold: Recognition confidence threshold
+            defer_save: Leave saving to the caller (via save_face_database)
+            face_location: Face location as (top, right, bottom, left), if
+                already known; skips detection
             
         Returns:
             bool: True if added successfully, False otherwise
@@ -142,39 +340,31 @@ class FaceRecognitionEngine:
         try:
             self.logger.info("Adding known face", name=name, image=str(image_path))
             
-            # Load and process the image
-            image = face_recognition.load_image_file(str(image_path))
-            
-            # Detect faces in the image
-            face_locations = face_recognition.face_locations(image)
+            # Load, detect and encode off the event loop
+            loop = asyncio.get_running_loop()
+            known_face = await loop.run_in_executor(
+                None,
+                self._process_image_sync,
+                name,
+                Path(image_path),
+                description,
+                confidence_threshold,
+                face_location,
+            )
             
-            if not face_locations:
-                self.logger.warning("No faces detected in image", image=str(image_path))
+            if known_face is None:
                 return False
             
-            if len(face_locations) > 1:
-                self.logger.warning("Multiple faces detected, using first one", image=str(image_path))
-            
-            # Get face encoding
-            face_encoding = face_recognition.face_encodings(image, [face_locations[0]])[0]
-            
-            # Create known face record
-            known_face = KnownFace(
-                name=name,
-                encoding=face_encoding,
-                description=description,
-                confidence_threshold=confidence_threshold,
-                added_date=datetime.now(),
-                image_path=str(image_path),
-            )
-            
             # Add to database
             self.known_faces.append(known_face)
-            self.face_encodings.append(face_encoding)
             self.face_names.append(name)
+            self._record_added(known_face)
+            self._matrix_stale = True
+            self._dirty = True
             
             # Save database
-            await self.save_face_database()
+            if not defer_save:
+                await self.save_face_database()
             
             self.logger.info("Known face added successfully", name=name)
             return True
@@ -183,12 +373,13 @@ class FaceRecognitionEngine:
             self.logger.error("Failed to add known face", error=str(e))
             return False
     
-    async def remove_known_face(self, name: str) -> bool:
+    async def remove_known_face(self, name: str, defer_save: bool = False) -> bool:
         """
         Remove a known face from the database.
         
         Args:
             name: Name of the person to remove
+            defer_save: Leave saving to the caller (via save_face_database)
             
         Returns:
             bool: True if removed successfully, False otherwise
@@ -196,43 +387,129 @@ class FaceRecognitionEngine:
         try:
             self.logger.info("Removing known face", name=name)
             
-            # Find and remove the face
-            indices_to_remove = []
-            
-            for i, face_name in enumerate(self.face_names):
-                if face_name == name:
-                    indices_to_remove.append(i)
-            
-            # Remove in reverse order to maintain indices
-            for i in reversed(indices_to_remove):
-                del self.face_names[i]
-                del self.face_encodings[i]
-                del self.known_faces[i]
+            # Keep every face not matching the name, in one pass per array
+            keep = np.fromiter(
+                (face_name != name for face_name in self.face_names),
+                dtype=bool,
+                count=len(self.face_names),
+            )
+            removed_count = len(keep) - int(np.count_nonzero(keep))
+            
+            if removed_count:
+                removed_latest = any(
+                    face.added_ts == self._latest_added
+                    for face, k in zip(self.known_faces, keep)
+                    if not k
+                )
+                self.face_names = [n for n, k in zip(self.face_names, keep) if k]
+                self.known_faces = [f for f, k in zip(self.known_faces, keep) if k]
+                if self._matrix_stale:
+                    self._refresh_encoding_matrix()
+                else:
+                    self._refresh_encoding_matrix(np.ascontiguousarray(self._enc_matrix[keep]))
+                self._dirty = True
+                
+                del self._name_counts[name]
+                if removed_latest:
+                    self._latest_added = max(
+                        (face.added_ts for face in self.known_faces), default=None
+                    )
             
             # Save database
-            await self.save_face_database()
+            if not defer_save:
+                await self.save_face_database()
             
-            self.logger.info("Known face removed successfully", name=name, removed_count=len(indices_to_remove))
+            self.logger.info("Known face removed successfully", name=name, removed_count=removed_count)
             return True
             
         except Exception as e:
             self.logger.error("Failed to remove known face", error=str(e))
             return False
     
-    def detect_faces(self, image: np.ndarray) -> List[Tuple[int, int, int, int]]:
+    def convert_frame(self, frame: np.ndarray) -> np.ndarray:
+        """
+        Convert an OpenCV BGR frame to the RGB layout face_recognition expects.
+        
+        The result is written into a buffer owned by the calling thread and
+        reused while the frame size stays the same, so a decode loop does not
+        allocate a new image per frame. It is overwritten by the next call on
+        the same thread; copy it if it must outlive that.
+        
+        Args:
+            frame: BGR uint8 image as returned by cv2.VideoCapture.read()
+            
+        Returns:
+            RGB image as a contiguous numpy array
+        """
+        import cv2
+        
+        buffer = getattr(self._frame_buffers, "rgb", None)
+        if buffer is None or buffer.shape != frame.shape or buffer.dtype != frame.dtype:
+            buffer = np.empty(frame.shape, dtype=frame.dtype)
+            self._frame_buffers.rgb = buffer
+        
+        return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=buffer)
+    
+    def detect_faces(
+        self,
+        image: np.ndarray,
+        downscale: Optional[float] = None,
+        upsample: Optional[int] = None,
+    ) -> List[Tuple[int, int, int, int]]:
         """
         Detect faces in an image.
         
+        Detection runs on a copy resized by ``downscale``; the detector cost
+        grows with pixel count, so halving each side cuts the work about 4x.
+        
         Args:
-            image: Input image as numpy array
+            image: Input RGB image as numpy array (see convert_frame for
+                OpenCV frames)
+            downscale: Resize factor before detection (defaults to the
+                face_recognition.detection_scale setting)
+            upsample: Times to upsample when looking for small faces
+                (defaults to the face_recognition.detection_upsample setting)
             
         Returns:
             List of face locations as (top, right, bottom, left) tuples
+            in the coordinates of the original image
         """
         try:
-            # Use face_recognition library for detection
-            face_locations = face_recognition.face_locations(image)
-            return face_locations
+            import cv2
+            import face_recognition
+            
+            face_settings = self._face_settings()
+            if downscale is None:
+                downscale = face_settings.detection_scale
+            if upsample is None:
+                upsample = face_settings.detection_upsample
+            
+            if downscale >= 1.0:
+                return face_recognition.face_locations(
+                    image,
+                    number_of_times_to_upsample=upsample,
+                    model=face_settings.detection_model,
+                )
+            
+            # Resize into a per-thread buffer; OpenCV only allocates a new one
+            # when the frame size or scale changes
+            small = cv2.resize(
+                image, (0, 0), dst=getattr(self._frame_buffers, "small", None),
+                fx=downscale, fy=downscale, interpolation=cv2.INTER_AREA,
+            )
+            self._frame_buffers.small = small
+            face_locations = face_recognition.face_locations(
+                small,
+                number_of_times_to_upsample=upsample,
+                model=face_settings.detection_model,
+            )
+            
+            # Map rectangles back to the full-size image
+            scale = 1.0 / downscale
+            return [
+                (round(top * scale), round(right * scale), round(bottom * scale), round(left * scale))
+                for top, right, bottom, left in face_locations
+            ]
             
         except Exception as e:
             self.logger.error("Failed to detect faces", error=str(e))
@@ -250,8 +527,12 @@ class FaceRecognitionEngine:
             Face encoding as numpy array, or None if failed
         """
         try:
+            import face_recognition
+            
             # Extract face encoding
-            face_encodings = face_recognition.face_encodings(image, [face_location])
+            face_encodings = face_recognition.face_encodings(
+                image, [face_location], model=self._face_settings().encoding_model
+            )
             
             if face_encodings:
                 return face_encodings[0]
@@ -262,6 +543,36 @@ class FaceRecognitionEngine:
             self.logger.error("Failed to get face encoding", error=str(e))
             return None
     
+    def get_face_encodings(
+        self, image: np.ndarray, face_locations: List[Tuple[int, int, int, int]]
+    ) -> List[np.ndarray]:
+        """
+        Get face encodings for all faces detected in one image.
+        
+        Landmarks and encodings for every location go through a single
+        face_recognition call instead of one call per face.
+        
+        Args:
+            image: Input image as numpy array
+            face_locations: Face locations as (top, right, bottom, left) tuples
+            
+        Returns:
+            One encoding per location, in order, or an empty list if failed
+        """
+        if not face_locations:
+            return []
+        
+        try:
+            import face_recognition
+            
+            return face_recognition.face_encodings(
+                image, face_locations, model=self._face_settings().encoding_model
+            )
+            
+        except Exception as e:
+            self.logger.error("Failed to get face encodings", error=str(e))
+            return []
+    
     def recognize_face(self, face_encoding: np.ndarray, tolerance: float = 0.6) -> str:
         """
         Recognize a face from its encoding.
@@ -274,35 +585,167 @@ class FaceRecognitionEngine:
             Name of the recognized person, or "Unknown" if not recognized
         """
         try:
-            if not self.is_loaded or not self.face_encodings:
+            self._ensure_encoding_matrix()
+            if not self.is_loaded or not len(self._enc_matrix):
                 return "Unknown"
             
-            # Compare with known faces
-            matches = face_recognition.compare_faces(
-                self.face_encodings,
-                face_encoding,
-                tolerance=tolerance
-            )
-            
-            if True in matches:
-                # Find the best match
-                face_distances = face_recognition.face_distance(self.face_encodings, face_encoding)
-                best_match_index = np.argmin(face_distances)
-                
-                if matches[best_match_index]:
-                    # Check confidence threshold
-                    confidence = 1 - face_distances[best_match_index]
-                    known_face = self.known_faces[best_match_index]
-                    
-                    if confidence >= known_face.confidence_threshold:
-                        return known_face.name
+            # The numba kernel's signature only accepts writable C arrays
+            query = np.require(face_encoding, np.float32, "CW")
+            
+            argmin_l2 = _argmin_l2_kernel()
+            if argmin_l2 is not None:
+                # Single fused pass over the matrix, no temporaries
+                best_match_index, best_distance_sq = argmin_l2(self._enc_matrix, query)
+                best_distance_sq = float(best_distance_sq)
+            elif simsimd is not None:
+                # SIMD kernel picked for this CPU; for the few hundred rows of
+                # a household database it skips BLAS dispatch overhead
+                distances_sq = np.asarray(
+                    simsimd.cdist(query[np.newaxis], self._enc_matrix, metric="sqeuclidean")
+                ).ravel()
+                best_match_index = int(distances_sq.argmin())
+                best_distance_sq = float(distances_sq[best_match_index])
+            else:
+                # Squared L2 distance via |a|^2 + |q|^2 - 2 a.q: a single SGEMV
+                # and no (N, 128) temporary
+                dots = self._enc_matrix @ query
+                distances_sq = self._encoding_sqnorms() + query @ query - 2.0 * dots
+                best_match_index = int(distances_sq.argmin())
+                # Rounding can push an exact match slightly below zero
+                best_distance_sq = max(float(distances_sq[best_match_index]), 0.0)
             
-            return "Unknown"
+            return self._match_name(best_match_index, best_distance_sq, tolerance)
             
         except Exception as e:
             self.logger.error("Failed to recognize face", error=str(e))
             return "Unknown"
     
+    def recognize_faces(self, face_encodings: List[np.ndarray], tolerance: float = 0.6) -> List[str]:
+        """
+        Recognize several faces at once.
+        
+        All distances come from one SGEMM of the queries against the known
+        encodings instead of a matrix-vector product per face.
+        
+        Args:
+            face_encodings: Face encodings to recognize
+            tolerance: Recognition tolerance (lower = more strict)
+            
+        Returns:
+            Names in the order of face_encodings, "Unknown" where not recognized
+        """
+        try:
+            self._ensure_encoding_matrix()
+            if not self.is_loaded or not len(self._enc_matrix):
+                return ["Unknown"] * len(face_encodings)
+            if not len(face_encodings):
+                return []
+            if len(face_encodings) == 1:
+                # A GEMM of one row gains nothing over the single-query kernels
+                return [self.recognize_face(face_encodings[0], tolerance)]
+            
+            queries = np.ascontiguousarray(face_encodings, dtype=np.float32).reshape(-1, _ENCODING_DIM)
+            distances_sq = self._encoding_sqnorms() - 2.0 * (queries @ self._enc_matrix.T)
+            best_indices = distances_sq.argmin(axis=1)
+            best_distances_sq = (
+                distances_sq[np.arange(len(queries)), best_indices]
+                + np.einsum("ij,ij->i", queries, queries)
+            )
+            
+            return [
+                # Rounding can push an exact match slightly below zero
+                self._match_name(int(index), max(float(distance_sq), 0.0), tolerance)
+                for index, distance_sq in zip(best_indices, best_distances_sq)
+            ]
+            
+        except Exception as e:
+            self.logger.error("Failed to recognize faces", error=str(e))
+            return ["Unknown"] * len(face_encodings)
+    
+    def _match_name(self, index: int, distance_sq: float, tolerance: float) -> str:
+        """Apply tolerance and per-face confidence checks to the nearest face."""
+        if distance_sq <= tolerance * tolerance:
+            # Check confidence threshold
+            confidence = 1 - np.sqrt(distance_sq)
+            known_face = self.known_faces[index]
+            
+            if confidence >= known_face.confidence_threshold:
+                return known_face.name
+        
+        return "Unknown"
+    
+    async def batch_add_known_faces(
+        self,
+        items: List[Tuple[str, Path, str]],
+        confidence_threshold: float = 0.6,
+    ) -> Dict[str, Any]:
+        """
+        Add several known faces, saving the database once at the end.
+        
+        Images are decoded, detected and encoded in worker threads, at most
+        one per CPU core at a time, which also bounds memory on the Pi. With
+        a CUDA-enabled dlib, chunks of _ENROLL_BATCH_SIZE images go through
+        the batched CNN detector instead.
+        
+        Args:
+            items: (name, image path, description) for each face image
+            confidence_threshold: Recognition confidence threshold
+            
+        Returns:
+            Dictionary with processing results
+        """
+        results = {
+            "processed": len(items),
+            "successful": 0,
+            "failed": 0,
+            "errors": [],
+        }
+        
+        loop = asyncio.get_running_loop()
+        
+        if _dlib_uses_cuda():
+            outcomes: List[Any] = []
+            for start in range(0, len(items), _ENROLL_BATCH_SIZE):
+                outcomes.extend(await loop.run_in_executor(
+                    None,
+                    self._process_images_batched_sync,
+                    items[start:start + _ENROLL_BATCH_SIZE],
+                    confidence_threshold,
+                ))
+        else:
+            semaphore = asyncio.Semaphore(os.cpu_count() or 4)
+            
+            async def _process(item: Tuple[str, Path, str]) -> Optional[KnownFace]:
+                async with semaphore:
+                    return await loop.run_in_executor(
+                        None, self._process_image_sync, *item, confidence_threshold
+                    )
+            
+            outcomes = await asyncio.gather(
+                *(_process(item) for item in items), return_exceptions=True
+            )
+        
+        # Outcomes come back in input order; mutate the database on this thread only
+        for (name, image_path, _), outcome in zip(items, outcomes):
+            if isinstance(outcome, KnownFace):
+                self.known_faces.append(outcome)
+                self.face_names.append(name)
+                self._record_added(outcome)
+                results["successful"] += 1
+            elif outcome is None:
+                results["failed"] += 1
+                results["errors"].append(f"Failed to process {image_path.name}")
+            else:
+                results["failed"] += 1
+                results["errors"].append(f"Error processing {image_path.name}: {str(outcome)}")
+        
+        if results["successful"]:
+            self._matrix_stale = True
+            self._dirty = True
+            await self.save_face_database()
+        
+        return results
+    
     async def batch_process_images(self, image_directory: Path) -> Dict[str, Any]:
         """
         Process a directory of images to build the face database.
@@ -323,33 +766,13 @@ class FaceRecognitionEngine:
         }
         
         try:
-            # Find all image files
-            image_extensions = {".jpg", ".jpeg", ".png", ".bmp", ".tiff"}
-            
-            for image_file in image_directory.rglob("*"):
-                if image_file.is_file() and image_file.suffix.lower() in image_extensions:
-                    results["processed"] += 1
-                    
-                    try:
-                        # Extract name from filename (assuming format: name.jpg)
-                        name = image_file.stem
-                        
-                        # Add to database
-                        success = await self.add_known_face(
-                            name=name,
-                            image_path=image_file,
-                            description=f"Auto-added from {image_file.name}",
-                        )
-                        
-                        if success:
-                            results["successful"] += 1
-                        else:
-                            results["failed"] += 1
-                            results["errors"].append(f"Failed to process {image_file.name}")
-                            
-                    except Exception as e:
-                        results["failed"] += 1
-                        results["errors"].append(f"Error processing {image_file.name}: {str(e)}")
+            # Name comes from the filename (assuming format: name.jpg)
+            items = [
+                (image_file.stem, image_file, f"Auto-added from {image_file.name}")
+                for image_file in map(Path, _iter_image_files(str(image_directory)))
+            ]
+            
+            results = await self.batch_add_known_faces(items)
             
             self.logger.info(
                 "Batch processing completed",
@@ -373,28 +796,18 @@ class FaceRecognitionEngine:
             Dictionary containing face database statistics
         """
         try:
-            stats = {
+            return {
                 "total_faces": len(self.known_faces),
-                "unique_names": len(set(self.face_names)),
-                "database_size_mb": self._get_database_size(),
-                "last_updated": None,
-                "name_distribution": {},
+                "unique_names": len(self._name_counts),
+                "database_size_mb": self._db_size_mb,
+                "last_updated": (
+                    datetime.fromtimestamp(self._latest_added)
+                    if self._latest_added is not None
+                    else None
+                ),
+                "name_distribution": dict(self._name_counts),
             }
             
-            # Calculate name distribution
-            name_counts = {}
-            for name in self.face_names:
-                name_counts[name] = name_counts.get(name, 0) + 1
-            
-            stats["name_distribution"] = name_counts
-            
-            # Get last updated time
-            if self.known_faces:
-                latest_face = max(self.known_faces, key=lambda x: x.added_date)
-                stats["last_updated"] = latest_face.added_date
-            
-            return stats
-            
         except Exception as e:
             self.logger.error("Failed to get face statistics", error=str(e))
             return {}
@@ -414,26 +827,29 @@ class FaceRecognitionEngine:
             }
             
             # Check for consistency
-            if len(self.known_faces) != len(self.face_encodings):
+            self._ensure_encoding_matrix()
+            if len(self.known_faces) != len(self._enc_matrix):
                 validation_results["is_valid"] = False
                 validation_results["errors"].append("Face count mismatch")
             
-            if len(self.face_encodings) != len(self.face_names):
+            if len(self.known_faces) != len(self.face_names):
                 validation_results["is_valid"] = False
                 validation_results["errors"].append("Name count mismatch")
             
             # Check for duplicate names
-            name_counts = {}
-            for name in self.face_names:
-                name_counts[name] = name_counts.get(name, 0) + 1
-            
-            for name, count in name_counts.items():
+            for name, count in Counter(self.face_names).items():
                 if count > 1:
                     validation_results["warnings"].append(f"Multiple encodings for {name}")
             
-            # Check encoding quality
-            for i, encoding in enumerate(self.face_encodings):
-                if encoding is None or len(encoding) == 0:
+            # Check encoding quality in one pass over the matrix
+            self._ensure_encoding_matrix()
+            matrix = self._enc_matrix
+            if matrix.ndim != 2 or matrix.shape[1] != _ENCODING_DIM:
+                validation_results["is_valid"] = False
+                validation_results["errors"].append(f"Invalid encoding shape {matrix.shape}")
+            else:
+                for i in np.flatnonzero(~np.isfinite(matrix).all(axis=1)):
+                    validation_results["is_valid"] = False
                     validation_results["errors"].append(f"Invalid encoding at index {i}")
             
             return validation_results
@@ -448,8 +864,10 @@ class FaceRecognitionEngine:
             self.logger.info("Creating new face database")
             
             self.known_faces = []
-            self.face_encodings = []
             self.face_names = []
+            self._refresh_encoding_matrix()
+            self._rebuild_statistics()
+            self._dirty = True
             
             # Create directory if it doesn't exist
             if self.model_path:
@@ -465,11 +883,200 @@ class FaceRecognitionEngine:
             self.logger.error("Failed to create new database", error=str(e))
             raise
     
+    def _process_image_sync(
+        self,
+        name: str,
+        image_path: Path,
+        description: str,
+        confidence_threshold: float,
+        face_location: Optional[Tuple[int, int, int, int]] = None,
+    ) -> Optional[KnownFace]:
+        """Load an image and build a KnownFace from its first face (blocking)."""
+        import face_recognition
+        
+        image = face_recognition.load_image_file(str(image_path))
+        if face_location is not None:
+            face_locations = [face_location]
+        else:
+            # Enrollment photos are close-up, so no upsampling is needed
+            face_locations = self.detect_faces(image, upsample=0)
+        return self._build_known_face(
+            name, image_path, description, confidence_threshold, image, face_locations
+        )
+    
+    def _process_images_batched_sync(
+        self,
+        items: List[Tuple[str, Path, str]],
+        confidence_threshold: float,
+    ) -> List[Any]:
+        """Build KnownFaces for a chunk using one batched detection (blocking)."""
+        import face_recognition
+        
+        outcomes: List[Any] = [None] * len(items)
+        images: Dict[int, np.ndarray] = {}
+        
+        for i, (_, image_path, _) in enumerate(items):
+            try:
+                images[i] = face_recognition.load_image_file(str(image_path))
+            except Exception as e:
+                outcomes[i] = e
+        
+        indices = list(images)
+        batch_locations = self._batch_face_locations([images[i] for i in indices])
+        
+        for i, face_locations in zip(indices, batch_locations):
+            name, image_path, description = items[i]
+            try:
+                outcomes[i] = self._build_known_face(
+                    name, image_path, description, confidence_threshold, images[i], face_locations
+                )
+            except Exception as e:
+                outcomes[i] = e
+        
+        return outcomes
+    
+    def _build_known_face(
+        self,
+        name: str,
+        image_path: Path,
+        description: str,
+        confidence_threshold: float,
+        image: np.ndarray,
+        face_locations: List[Tuple[int, int, int, int]],
+    ) -> Optional[KnownFace]:
+        """Encode the first detected face; None when the image has no face."""
+        import face_recognition
+        
+        if not face_locations:
+            self.logger.warning("No faces detected in image", image=str(image_path))
+            return None
+        
+        if len(face_locations) > 1:
+            self.logger.warning("Multiple faces detected, using first one", image=str(image_path))
+        
+        # Get face encoding
+        face_encoding = face_recognition.face_encodings(
+            image, [face_locations[0]], model=self._face_settings().encoding_model
+        )[0]
+        
+        return KnownFace(
+            name=name,
+            encoding=face_encoding,
+            description=description,
+            confidence_threshold=confidence_threshold,
+            image_path=str(image_path),
+        )
+    
+    def _batch_face_locations(self, images: List[np.ndarray]) -> List[List[Tuple[int, int, int, int]]]:
+        """Detect faces in several images, batching on the GPU when dlib has CUDA."""
+        if not _dlib_uses_cuda():
+            # Batched detection is CNN-only, which is far slower than HOG on a CPU
+            return [self.detect_faces(image) for image in images]
+        
+        import face_recognition
+        
+        # batch_face_locations needs every image in a batch to share one shape
+        by_shape: Dict[Tuple[int, ...], List[int]] = defaultdict(list)
+        for i, image in enumerate(images):
+            by_shape[image.shape].append(i)
+        
+        locations: List[List[Tuple[int, int, int, int]]] = [[] for _ in images]
+        for indices in by_shape.values():
+            batch = face_recognition.batch_face_locations(
+                [images[i] for i in indices],
+                number_of_times_to_upsample=0,
+                batch_size=_ENROLL_BATCH_SIZE,
+            )
+            for i, face_locations in zip(indices, batch):
+                locations[i] = face_locations
+        return locations
+    
+    def _face_settings(self) -> FaceRecognitionSettings:
+        """Face recognition settings, falling back to defaults without Settings."""
+        if self.settings is not None:
+            return self.settings.face_recognition
+        return _DEFAULT_FACE_SETTINGS
+    
+    def _metadata_path(self) -> Path:
+        """Path of the JSON sidecar holding everything but the encodings."""
+        return self.model_path.with_suffix(".json")
+    
+    def _load_arrays(self) -> None:
+        """Load the .npy encodings (memory-mapped) and their JSON metadata."""
+        with open(self._metadata_path(), "rb") as f:
+            metadata = _load_metadata(f.read())
+        
+        # Copy-on-write mapping: pages are read from disk only when touched
+        matrix = np.load(self.model_path, mmap_mode="c")
+        records = metadata.get("known_faces", [])
+        if matrix.ndim != 2 or len(records) != matrix.shape[0]:
+            raise RuntimeError("Face database metadata does not match encodings")
+        
+        self.known_faces = [
+            KnownFace.from_dict(record, encoding=row) for record, row in zip(records, matrix)
+        ]
+        self.face_names = [face.name for face in self.known_faces]
+        self._refresh_encoding_matrix(matrix)
+        self._rebuild_statistics()
+    
+    def _load_legacy_pickle(self, legacy_path: Path) -> None:
+        """Load a database saved by older versions as a single pickle."""
+        with open(legacy_path, "rb") as f:
+            data = pickle.load(f)
+        
+        self.known_faces = data.get("known_faces", [])
+        self.face_names = data.get("names", [])
+        self._refresh_encoding_matrix()
+        self._rebuild_statistics()
+    
+    def _rebuild_statistics(self) -> None:
+        """Recompute the cached name counts and latest add date from scratch."""
+        self._name_counts = Counter(self.face_names)
+        self._latest_added = max((face.added_ts for face in self.known_faces), default=None)
+    
+    def _record_added(self, known_face: KnownFace) -> None:
+        """Update the cached statistics for one newly added face."""
+        self._name_counts[known_face.name] += 1
+        if self._latest_added is None or known_face.added_ts > self._latest_added:
+            self._latest_added = known_face.added_ts
+    
+    def _ensure_encoding_matrix(self) -> None:
+        """Rebuild the encoding matrix if known_faces changed since."""
+        if self._matrix_stale:
+            self._refresh_encoding_matrix()
+    
+    def _refresh_encoding_matrix(self, matrix: Optional[np.ndarray] = None) -> None:
+        """
+        Rebuild the float32 encoding matrix after known_faces changes.
+        
+        Nothing here reads the matrix, so a memory-mapped one stays on disk
+        until the first match touches it.
+        """
+        if matrix is not None:
+            self._enc_matrix = matrix
+        elif self.known_faces:
+            self._enc_matrix = np.ascontiguousarray(
+                np.stack([face.encoding for face in self.known_faces]), dtype=np.float32
+            )
+        else:
+            self._enc_matrix = np.empty((0, _ENCODING_DIM), dtype=np.float32)
+        self._matrix_stale = False
+        self._enc_sqnorms = None
+    
+    def _encoding_sqnorms(self) -> np.ndarray:
+        """Squared norms of the encoding matrix rows, computed once per matrix."""
+        if self._enc_sqnorms is None:
+            self._enc_sqnorms = np.einsum("ij,ij->i", self._enc_matrix, self._enc_matrix)
+        return self._enc_sqnorms
+    
     def _get_database_size(self) -> float:
         """Get the size of the face database in MB."""
         try:
             if self.model_path and self.model_path.exists():
                 size_bytes = self.model_path.stat().st_size
+                metadata_path = self._metadata_path()
+                if metadata_path.exists():
+                    size_bytes += metadata_path.stat().st_size
                 return size_bytes / (1024 * 1024)
             return 0.0
         except Exception:
@@ -6,16 +6,158 @@ monitoring for the Blink camera system enhancement.
 """
 
 import asyncio
+import errno
+import heapq
+import itertools
+import os
+import re
 import shutil
-from datetime import datetime, timedelta
+import threading
+import time
+import uuid
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Set, Tuple, Any
 
 import psutil
 import structlog
 
 from blink_sync_brain.config.settings import Settings
 
+# Directories with at most this many subdirectories are cleaned on one
+# thread; below it, starting workers costs more than it saves
+_PARALLEL_MIN_SUBDIRS = 4
+
+# Hidden directory under each storage root that expired files are renamed
+# into; it is emptied in the background and skipped by every walk
+_TRASH_DIR_NAME = ".blink_trash"
+
+# Seconds a disk usage reading is reused for back-to-back pressure checks
+_DISK_PRESSURE_TTL = 5.0
+
+# File extensions buffered before each Counter.update in statistics walks
+_EXTENSION_BATCH_SIZE = 4096
+
+# Deleted paths kept in cleanup results; the full list goes to a log file
+_DELETED_FILES_SAMPLE = 1000
+
+# Deleted paths a cleanup worker buffers before handing them over
+_DELETED_FILES_CHUNK = 1024
+
+# Cleanup is skipped while disk usage is this many points below the threshold
+_CLEANUP_SKIP_MARGIN = 5.0
+
+# Name of a per-day archive directory, e.g. "2024-01-31"
+_DAY_DIR_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+# Days a day directory must be past the cutoff date to be skipped unread;
+# absorbs a camera clock or timezone that differs from the Processor's
+_DAY_DIR_MARGIN = timedelta(days=1)
+
+
+def _walk_files(directory: str) -> Iterator[os.DirEntry]:
+    """
+    Yield a DirEntry for every regular file under directory, recursively.
+    
+    os.scandir reads each directory in one batch and reports file types
+    from it, and DirEntry.stat() caches its result, so each file costs at
+    most one stat call instead of the two or three of rglob/is_file/stat.
+    On Windows the directory listing already carries size and times, so
+    DirEntry.stat() costs no call at all, whereas Path.stat() opens a
+    handle per file. Symlinks are not followed.
+    
+    That one call is a plain lstat: on local filesystems statx() with
+    AT_STATX_DONT_SYNC and a reduced mask returns the same cached inode
+    data, so it only pays off on network mounts the archive never uses.
+    """
+    pending = [directory]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name != _TRASH_DIR_NAME:
+                            pending.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        yield entry
+        except PermissionError:
+            # Match rglob, which skips directories it cannot read
+            continue
+
+
+@lru_cache(maxsize=4096)
+def _day_dir_date(name: str) -> Optional[date]:
+    """Return the date a YYYY-MM-DD directory name stands for, or None."""
+    if not _DAY_DIR_PATTERN.fullmatch(name):
+        return None
+    try:
+        return datetime.strptime(name, "%Y-%m-%d").date()
+    except ValueError:
+        return None
+
+
+def _drop_page_cache(*paths: Path) -> None:
+    """
+    Ask the kernel to evict the cached pages of files that were just copied.
+    
+    A copy reads and writes the whole clip through the page cache, pushing
+    out pages of the recordings currently being processed. Best effort, and
+    a no-op where posix_fadvise is unavailable.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    for path in paths:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+
+def _split_dir(directory: str) -> Tuple[List[str], List[os.DirEntry]]:
+    """List the subdirectory paths and the regular files directly in directory."""
+    subdirs: List[str] = []
+    files: List[os.DirEntry] = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name != _TRASH_DIR_NAME:
+                    subdirs.append(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                files.append(entry)
+    return subdirs, files
+
+
+class _DeletedFilesRecorder:
+    """Keeps the most recent deleted paths and optionally logs all of them."""
+    
+    def __init__(self, log_path: Optional[Path] = None):
+        self.sample: deque = deque(maxlen=_DELETED_FILES_SAMPLE)
+        self._lock = threading.Lock()
+        self._log = open(log_path, "a", encoding="utf-8") if log_path else None
+    
+    def add(self, paths: List[str]) -> None:
+        """Record a chunk of deleted paths; safe to call from worker threads."""
+        with self._lock:
+            self.sample.extend(paths)
+            if self._log is not None:
+                self._log.writelines(f"{path}\n" for path in paths)
+    
+    def close(self) -> None:
+        """Flush and close the log file, if any."""
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+
 
 class StorageManager:
     """
@@ -29,13 +171,37 @@ class StorageManager:
         """Initialize the Storage Manager."""
         self.settings = settings
         self.logger = structlog.get_logger()
+        # Per-file debug events are only built when they would be wanted
+        self._debug_enabled = settings.logging.level.upper() == "DEBUG"
+        
+        # Storage policy, read once; Settings are not changed after startup
+        storage = settings.storage
+        self._video_dir: Path = storage.video_directory
+        self._results_dir: Path = storage.results_directory
+        self._retention_days = storage.retention_days
+        self._retention = timedelta(days=storage.retention_days)
+        self._cleanup_threshold = storage.cleanup_threshold
+        self._monitor_interval = storage.monitor_interval
         self.is_monitoring = False
+        # Worker threads for cleanup sweeps, created on first use
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # Trash directories holding files still to be unlinked
+        self._trash_dirs: Set[Path] = set()
+        self._purge_task: Optional[asyncio.Task] = None
+        # (monotonic time, usage percent) of the last disk pressure reading
+        self._disk_pressure: Optional[Tuple[float, float]] = None
         
     async def start_storage_monitoring(self) -> None:
         """Start storage monitoring service."""
         self.logger.info("Starting storage monitoring service")
         self.is_monitoring = True
         
+        # Finish deletes left over from a previous run
+        for directory in (self._video_dir, self._results_dir):
+            if (directory / _TRASH_DIR_NAME).is_dir():
+                self._trash_dirs.add(directory / _TRASH_DIR_NAME)
+        self._schedule_trash_purge()
+        
         # Start monitoring loop
         asyncio.create_task(self._monitoring_loop())
         
@@ -45,6 +211,10 @@ class StorageManager:
         """Stop storage monitoring service."""
         self.logger.info("Stopping storage monitoring service")
         self.is_monitoring = False
+        
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
     
     async def get_storage_statistics(self) -> Dict[str, Any]:
         """
@@ -55,7 +225,7 @@ class StorageManager:
         """
         try:
             # Get disk usage for video directory
-            video_dir = self.settings.storage.video_directory
+            video_dir = self._video_dir
             if video_dir.exists():
                 disk_usage = psutil.disk_usage(video_dir)
                 video_stats = {
@@ -67,11 +237,35 @@ class StorageManager:
             else:
                 video_stats = {"error": "Video directory does not exist"}
             
-            # Get file statistics
-            file_stats = await self._get_file_statistics()
+            # File and cleanup statistics come from a single walk
+            cutoff_date = datetime.now() - self._retention
+            
+            file_stats = {
+                "total_files": 0,
+                "total_size_bytes": 0,
+                "file_types": Counter(),
+                "oldest_file": None,
+                "newest_file": None,
+            }
+            cleanup_stats = {
+                "retention_days": self._retention_days,
+                "cutoff_date": cutoff_date,
+                "files_eligible_for_cleanup": 0,
+                "bytes_eligible_for_cleanup": 0,
+            }
             
-            # Get cleanup statistics
-            cleanup_stats = await self._get_cleanup_statistics()
+            # The walk blocks on the filesystem, so keep it off the event loop
+            loop = asyncio.get_running_loop()
+            for directory in (self._video_dir, self._results_dir):
+                if directory.exists():
+                    await loop.run_in_executor(
+                        self._get_executor(),
+                        self._walk_and_collect,
+                        directory,
+                        cutoff_date,
+                        file_stats,
+                        cleanup_stats,
+                    )
             
             stats = {
                 "video_directory": video_stats,
@@ -86,18 +280,58 @@ class StorageManager:
             self.logger.error("Failed to get storage statistics", error=str(e))
             return {"error": str(e)}
     
-    async def cleanup_old_files(self, dry_run: bool = False) -> Dict[str, Any]:
+    async def cleanup_old_files(
+        self,
+        dry_run: bool = False,
+        deleted_files_log: Optional[Path] = None,
+        only_under_pressure: bool = False,
+    ) -> Dict[str, Any]:
         """
         Clean up old files based on retention policy.
         
+        Expired files are renamed into a trash directory on the same
+        filesystem, which is a metadata-only operation, and unlinked by a
+        background task; bytes_freed counts them as soon as they are moved.
+        
+        Only the last few deleted paths are returned in deleted_files; pass
+        deleted_files_log to have every path appended to a file.
+        
+        With only_under_pressure set, nothing is deleted and the archive is
+        not walked at all while disk usage is comfortably below the cleanup
+        threshold. Dry runs always report.
+        
         Args:
             dry_run: If True, only report what would be deleted
+            deleted_files_log: File to append all deleted paths to
+            only_under_pressure: Skip the cleanup while disk usage is low
             
         Returns:
             Dictionary containing cleanup results
         """
+        recorder = None
         try:
+            if only_under_pressure and not dry_run:
+                usage_percent = self._check_disk_pressure()
+                skip_below = self._cleanup_threshold - _CLEANUP_SKIP_MARGIN
+                if usage_percent is not None and usage_percent < skip_below:
+                    self.logger.info(
+                        "Storage usage below threshold, skipping cleanup",
+                        usage_percent=usage_percent,
+                        threshold=self._cleanup_threshold,
+                    )
+                    return {
+                        "skipped": True,
+                        "reason": "below_threshold",
+                        "usage_percent": usage_percent,
+                        "files_processed": 0,
+                        "files_deleted": 0,
+                        "bytes_freed": 0,
+                        "errors": [],
+                        "deleted_files": [],
+                    }
+            
             self.logger.info("Starting file cleanup", dry_run=dry_run)
+            recorder = _DeletedFilesRecorder(deleted_files_log)
             
             results = {
                 "files_processed": 0,
@@ -108,31 +342,31 @@ class StorageManager:
             }
             
             # Calculate cutoff date
-            cutoff_date = datetime.now() - timedelta(days=self.settings.storage.retention_days)
+            cutoff_date = datetime.now() - self._retention
             
             # Process video directory
-            video_dir = self.settings.storage.video_directory
+            video_dir = self._video_dir
             if video_dir.exists():
                 video_results = await self._cleanup_directory(
-                    video_dir, cutoff_date, dry_run
+                    video_dir, cutoff_date, dry_run, recorder
                 )
-                results["files_processed"] += video_results["files_processed"]
-                results["files_deleted"] += video_results["files_deleted"]
-                results["bytes_freed"] += video_results["bytes_freed"]
-                results["errors"].extend(video_results["errors"])
-                results["deleted_files"].extend(video_results["deleted_files"])
+                self._merge_cleanup_results(results, video_results)
             
             # Process results directory
-            results_dir = self.settings.storage.results_directory
+            results_dir = self._results_dir
             if results_dir.exists():
                 result_results = await self._cleanup_directory(
-                    results_dir, cutoff_date, dry_run
+                    results_dir, cutoff_date, dry_run, recorder
                 )
-                results["files_processed"] += result_results["files_processed"]
-                results["files_deleted"] += result_results["files_deleted"]
-                results["bytes_freed"] += result_results["bytes_freed"]
-                results["errors"].extend(result_results["errors"])
-                results["deleted_files"].extend(result_results["deleted_files"])
+                self._merge_cleanup_results(results, result_results)
+            
+            results["deleted_files"] = list(recorder.sample)
+            if deleted_files_log is not None:
+                results["deleted_files_log"] = str(deleted_files_log)
+            
+            if not dry_run and results["files_deleted"]:
+                self._disk_pressure = None
+                self._schedule_trash_purge()
             
             self.logger.info(
                 "File cleanup completed",
@@ -147,47 +381,66 @@ class StorageManager:
         except Exception as e:
             self.logger.error("Failed to cleanup old files", error=str(e))
             return {"error": str(e)}
+        
+        finally:
+            if recorder is not None:
+                recorder.close()
     
-    async def get_file_list(self, directory: Optional[Path] = None) -> List[Dict[str, Any]]:
+    async def get_file_list(
+        self, directory: Optional[Path] = None, limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
         """
-        Get a list of files in the specified directory.
+        Get a list of files in the specified directory, newest first.
         
         Args:
             directory: Directory to list files from (defaults to video directory)
+            limit: Return only this many of the newest files
             
         Returns:
             List of file information dictionaries
         """
         try:
             if directory is None:
-                directory = self.settings.storage.video_directory
+                directory = self._video_dir
             
             if not directory.exists():
                 return []
             
-            files = []
-            
-            for file_path in directory.rglob("*"):
-                if file_path.is_file():
-                    stat = file_path.stat()
-                    files.append({
-                        "name": file_path.name,
-                        "path": str(file_path),
-                        "size_bytes": stat.st_size,
-                        "created": datetime.fromtimestamp(stat.st_ctime),
-                        "modified": datetime.fromtimestamp(stat.st_mtime),
-                        "extension": file_path.suffix.lower(),
-                    })
-            
-            # Sort by modification time (newest first)
-            files.sort(key=lambda x: x["modified"], reverse=True)
-            
-            return files
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), self._list_files, directory, limit)
             
         except Exception as e:
             self.logger.error("Failed to get file list", error=str(e))
             return []
     
+    @staticmethod
+    def _list_files(directory: Path, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Describe the files under directory, newest first (blocking)."""
+        candidates = []
+        for entry in _walk_files(os.fspath(directory)):
+            stat = entry.stat(follow_symlinks=False)
+            candidates.append((stat.st_mtime, entry, stat))
+        
+        # Sort by modification time (newest first); only the files that are
+        # returned get turned into dicts
+        by_mtime = itemgetter(0)
+        if limit is not None:
+            candidates = heapq.nlargest(limit, candidates, key=by_mtime)
+        else:
+            candidates.sort(key=by_mtime, reverse=True)
+        
+        return [
+            {
+                "name": entry.name,
+                "path": entry.path,
+                "size_bytes": stat.st_size,
+                "created": datetime.fromtimestamp(stat.st_ctime),
+                "modified": datetime.fromtimestamp(mtime),
+                "extension": os.path.splitext(entry.name)[1].lower(),
+            }
+            for mtime, entry, stat in candidates
+        ]
+    
     async def move_file(self, source_path: Path, destination_path: Path) -> bool:
         """
         Move a file from source to destination.
@@ -205,8 +458,14 @@ class StorageManager:
             # Create destination directory if it doesn't exist
             destination_path.parent.mkdir(parents=True, exist_ok=True)
             
-            # Move the file
-            shutil.move(str(source_path), str(destination_path))
+            # Move the file; a rename unless it crosses filesystems
+            try:
+                os.rename(source_path, destination_path)
+            except OSError as e:
+                if e.errno not in (errno.EXDEV, errno.EISDIR):
+                    raise
+                shutil.move(str(source_path), str(destination_path))
+                _drop_page_cache(destination_path)
             
             self.logger.info("File moved successfully")
             return True
@@ -234,6 +493,7 @@ class StorageManager:
             
             # Copy the file
             shutil.copy2(str(source_path), str(destination_path))
+            _drop_page_cache(source_path, destination_path)
             
             self.logger.info("File copied successfully")
             return True
@@ -273,201 +533,461 @@ class StorageManager:
         
         while self.is_monitoring:
             try:
-                # Get storage statistics
-                stats = await self.get_storage_statistics()
+                # Check if cleanup is needed; the full statistics walk is
+                # left to callers that actually report them
+                usage_percent = self._check_disk_pressure()
                 
-                # Check if cleanup is needed
-                if "video_directory" in stats and "usage_percent" in stats["video_directory"]:
-                    usage_percent = stats["video_directory"]["usage_percent"]
+                if usage_percent is not None and usage_percent > self._cleanup_threshold:
+                    self.logger.warning(
+                        "Storage usage above threshold, starting cleanup",
+                        usage_percent=usage_percent,
+                        threshold=self._cleanup_threshold,
+                    )
                     
-                    if usage_percent > self.settings.storage.cleanup_threshold:
-                        self.logger.warning(
-                            "Storage usage above threshold, starting cleanup",
-                            usage_percent=usage_percent,
-                            threshold=self.settings.storage.cleanup_threshold,
-                        )
-                        
-                        # Perform cleanup
-                        await self.cleanup_old_files(dry_run=False)
+                    # Perform cleanup
+                    await self.cleanup_old_files(dry_run=False, only_under_pressure=True)
                 
                 # Wait before next check
-                await asyncio.sleep(self.settings.storage.monitor_interval)
+                await asyncio.sleep(self._monitor_interval)
                 
             except Exception as e:
                 self.logger.error("Error in storage monitoring loop", error=str(e))
                 await asyncio.sleep(60)  # Wait longer on error
     
-    async def _get_file_statistics(self) -> Dict[str, Any]:
-        """Get file statistics for the storage directories."""
+    def _check_disk_pressure(self) -> Optional[float]:
+        """
+        Get the usage percentage of the video directory's filesystem.
+        
+        This is a single statvfs call, reused for _DISK_PRESSURE_TTL seconds.
+        
+        Returns:
+            Usage percentage, or None if the video directory does not exist
+        """
+        now = time.monotonic()
+        if self._disk_pressure is not None and now - self._disk_pressure[0] < _DISK_PRESSURE_TTL:
+            return self._disk_pressure[1]
+        
+        video_dir = self._video_dir
+        if not video_dir.exists():
+            return None
+        
+        disk_usage = shutil.disk_usage(video_dir)
+        usage_percent = (disk_usage.used / disk_usage.total) * 100
+        self._disk_pressure = (now, usage_percent)
+        return usage_percent
+    
+    def _walk_and_collect(
+        self,
+        directory: Path,
+        cutoff_date: datetime,
+        file_stats: Dict[str, Any],
+        cleanup_stats: Dict[str, Any],
+    ) -> None:
+        """Add one directory's files to the file and cleanup statistics."""
+        # Extensions are counted in batches; Counter.update tallies an
+        # iterable in C instead of a get/set round trip per file
+        extensions: List[str] = []
+        # Compare raw mtimes; datetimes are only built for the results
+        cutoff_ts = cutoff_date.timestamp()
+        oldest: Optional[Tuple[float, os.DirEntry, int]] = None
+        newest: Optional[Tuple[float, os.DirEntry, int]] = None
+        
+        for entry in _walk_files(os.fspath(directory)):
+            stat = entry.stat(follow_symlinks=False)
+            mtime = stat.st_mtime
+            
+            file_stats["total_files"] += 1
+            file_stats["total_size_bytes"] += stat.st_size
+            
+            # Count file types
+            extensions.append(os.path.splitext(entry.name)[1].lower())
+            if len(extensions) >= _EXTENSION_BATCH_SIZE:
+                file_stats["file_types"].update(extensions)
+                extensions.clear()
+            
+            # Track oldest/newest files
+            if oldest is None or mtime < oldest[0]:
+                oldest = (mtime, entry, stat.st_size)
+            if newest is None or mtime > newest[0]:
+                newest = (mtime, entry, stat.st_size)
+            
+            # Count files eligible for cleanup
+            if mtime < cutoff_ts:
+                cleanup_stats["files_eligible_for_cleanup"] += 1
+                cleanup_stats["bytes_eligible_for_cleanup"] += stat.st_size
+        
+        file_stats["file_types"].update(extensions)
+        
+        if oldest is not None:
+            file_info = self._file_info(*oldest)
+            if not file_stats["oldest_file"] or file_info["modified"] < file_stats["oldest_file"]["modified"]:
+                file_stats["oldest_file"] = file_info
+        
+        if newest is not None:
+            file_info = self._file_info(*newest)
+            if not file_stats["newest_file"] or file_info["modified"] > file_stats["newest_file"]["modified"]:
+                file_stats["newest_file"] = file_info
+    
+    @staticmethod
+    def _file_info(mtime: float, entry: os.DirEntry, size: int) -> Dict[str, Any]:
+        """Describe a file for the oldest/newest statistics."""
+        return {
+            "name": entry.name,
+            "path": entry.path,
+            "size_bytes": size,
+            "modified": datetime.fromtimestamp(mtime),
+        }
+    
+    async def _cleanup_directory(
+        self,
+        directory: Path,
+        cutoff_date: datetime,
+        dry_run: bool,
+        recorder: _DeletedFilesRecorder,
+    ) -> Dict[str, Any]:
+        """
+        Clean up files in a specific directory.
+        
+        When the directory has more than _PARALLEL_MIN_SUBDIRS subdirectories
+        (typically one per camera or day), each subtree is swept on its own
+        worker thread; unlinks in different directories do not contend.
+        With fewer subdirectories, e.g. one per camera holding one directory
+        per day, the work is split one level further down instead. A day
+        directory that has expired as a whole is moved to the trash with a
+        single rename (see _discard_bucket).
+        """
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        # The sweep works on os.scandir paths, which are plain strings
+        path = os.fspath(directory)
+        
         try:
-            stats = {
-                "total_files": 0,
-                "total_size_bytes": 0,
-                "file_types": {},
-                "oldest_file": None,
-                "newest_file": None,
-            }
-            
-            # Process video directory
-            video_dir = self.settings.storage.video_directory
-            if video_dir.exists():
-                video_stats = await self._get_directory_stats(video_dir)
-                stats["total_files"] += video_stats["total_files"]
-                stats["total_size_bytes"] += video_stats["total_size_bytes"]
-                
-                # Merge file types
-                for ext, count in video_stats["file_types"].items():
-                    stats["file_types"][ext] = stats["file_types"].get(ext, 0) + count
-                
-                # Update oldest/newest files
-                if video_stats["oldest_file"]:
-                    if not stats["oldest_file"] or video_stats["oldest_file"]["modified"] < stats["oldest_file"]["modified"]:
-                        stats["oldest_file"] = video_stats["oldest_file"]
-                
-                if video_stats["newest_file"]:
-                    if not stats["newest_file"] or video_stats["newest_file"]["modified"] > stats["newest_file"]["modified"]:
-                        stats["newest_file"] = video_stats["newest_file"]
-            
-            # Process results directory
-            results_dir = self.settings.storage.results_directory
-            if results_dir.exists():
-                result_stats = await self._get_directory_stats(results_dir)
-                stats["total_files"] += result_stats["total_files"]
-                stats["total_size_bytes"] += result_stats["total_size_bytes"]
-                
-                # Merge file types
-                for ext, count in result_stats["file_types"].items():
-                    stats["file_types"][ext] = stats["file_types"].get(ext, 0) + count
-                
-                # Update oldest/newest files
-                if result_stats["oldest_file"]:
-                    if not stats["oldest_file"] or result_stats["oldest_file"]["modified"] < stats["oldest_file"]["modified"]:
-                        stats["oldest_file"] = result_stats["oldest_file"]
-                
-                if result_stats["newest_file"]:
-                    if not stats["newest_file"] or result_stats["newest_file"]["modified"] > stats["newest_file"]["modified"]:
-                        stats["newest_file"] = result_stats["newest_file"]
-            
-            return stats
-            
+            # Listing the tree is blocking I/O too, so it runs on the pool
+            trash_dir, subdirs, top_files = await loop.run_in_executor(
+                executor, self._plan_cleanup, path, dry_run
+            )
         except Exception as e:
-            self.logger.error("Failed to get file statistics", error=str(e))
-            return {"error": str(e)}
+            error_msg = f"Failed to cleanup directory {directory}: {str(e)}"
+            self.logger.error(error_msg)
+            return {
+                "files_processed": 0,
+                "files_deleted": 0,
+                "bytes_freed": 0,
+                "errors": [error_msg],
+            }
+        
+        if len(subdirs) <= _PARALLEL_MIN_SUBDIRS:
+            # One worker for the whole tree, still off the event loop
+            return await loop.run_in_executor(
+                executor,
+                self._cleanup_tree,
+                path,
+                top_files,
+                subdirs,
+                cutoff_date,
+                dry_run,
+                trash_dir,
+                recorder,
+            )
+        
+        parts = await asyncio.gather(
+            loop.run_in_executor(
+                executor,
+                self._cleanup_entries,
+                path,
+                iter(top_files),
+                cutoff_date,
+                dry_run,
+                trash_dir,
+                recorder,
+            ),
+            *(
+                loop.run_in_executor(
+                    executor,
+                    self._cleanup_subdir,
+                    subdir,
+                    cutoff_date,
+                    dry_run,
+                    trash_dir,
+                    recorder,
+                )
+                for subdir in subdirs
+            ),
+        )
+        
+        results = parts[0]
+        for part in parts[1:]:
+            self._merge_cleanup_results(results, part)
+        return results
     
-    async def _get_directory_stats(self, directory: Path) -> Dict[str, Any]:
-        """Get statistics for a specific directory."""
-        try:
-            stats = {
-                "total_files": 0,
-                "total_size_bytes": 0,
-                "file_types": {},
-                "oldest_file": None,
-                "newest_file": None,
+    def _plan_cleanup(
+        self, directory: str, dry_run: bool
+    ) -> Tuple[Optional[Path], List[str], List[os.DirEntry]]:
+        """
+        Prepare the trash directory and split directory into work units.
+        
+        Returns:
+            The trash directory (None for a dry run), the subdirectories to
+            sweep as separate units and the files to sweep directly
+        """
+        trash_dir = None
+        if not dry_run:
+            trash_dir = Path(directory, _TRASH_DIR_NAME)
+            trash_dir.mkdir(exist_ok=True)
+            self._trash_dirs.add(trash_dir)
+        
+        subdirs, top_files = _split_dir(directory)
+        if len(subdirs) <= _PARALLEL_MIN_SUBDIRS:
+            nested_subdirs: List[str] = []
+            nested_files = list(top_files)
+            for subdir in subdirs:
+                try:
+                    child_dirs, child_files = _split_dir(subdir)
+                except PermissionError:
+                    continue
+                nested_subdirs.extend(child_dirs)
+                nested_files.extend(child_files)
+            if len(nested_subdirs) > _PARALLEL_MIN_SUBDIRS:
+                subdirs, top_files = nested_subdirs, nested_files
+        
+        return trash_dir, subdirs, top_files
+    
+    def _cleanup_tree(
+        self,
+        directory: str,
+        top_files: List[os.DirEntry],
+        subdirs: List[str],
+        cutoff_date: datetime,
+        dry_run: bool,
+        trash_dir: Optional[Path],
+        recorder: _DeletedFilesRecorder,
+    ) -> Dict[str, Any]:
+        """Sweep the top-level files and then each subdirectory in turn."""
+        results = self._cleanup_entries(
+            directory, iter(top_files), cutoff_date, dry_run, trash_dir, recorder
+        )
+        for subdir in subdirs:
+            self._merge_cleanup_results(
+                results,
+                self._cleanup_subdir(subdir, cutoff_date, dry_run, trash_dir, recorder),
+            )
+        return results
+    
+    def _cleanup_subdir(
+        self,
+        subdir: str,
+        cutoff_date: datetime,
+        dry_run: bool,
+        trash_dir: Optional[Path],
+        recorder: _DeletedFilesRecorder,
+    ) -> Dict[str, Any]:
+        """
+        Sweep one subdirectory, discarding it whole if it is an expired day.
+        
+        A directory named after a day later than the cutoff date is skipped
+        without being read: it only holds clips recorded on that day. Its
+        files are not counted in files_processed. Other directories, such as
+        one per camera, are never removed; only their old files are.
+        """
+        day = _day_dir_date(os.path.basename(subdir))
+        if day is not None and day > cutoff_date.date() + _DAY_DIR_MARGIN:
+            return {
+                "files_processed": 0,
+                "files_deleted": 0,
+                "bytes_freed": 0,
+                "errors": [],
             }
-            
-            for file_path in directory.rglob("*"):
-                if file_path.is_file():
-                    stat = file_path.stat()
-                    
-                    stats["total_files"] += 1
-                    stats["total_size_bytes"] += stat.st_size
-                    
-                    # Count file types
-                    ext = file_path.suffix.lower()
-                    stats["file_types"][ext] = stats["file_types"].get(ext, 0) + 1
-                    
-                    # Track oldest/newest files
-                    file_info = {
-                        "name": file_path.name,
-                        "path": str(file_path),
-                        "size_bytes": stat.st_size,
-                        "modified": datetime.fromtimestamp(stat.st_mtime),
-                    }
-                    
-                    if not stats["oldest_file"] or file_info["modified"] < stats["oldest_file"]["modified"]:
-                        stats["oldest_file"] = file_info
-                    
-                    if not stats["newest_file"] or file_info["modified"] > stats["newest_file"]["modified"]:
-                        stats["newest_file"] = file_info
-            
-            return stats
-            
-        except Exception as e:
-            self.logger.error("Failed to get directory stats", error=str(e))
-            return {"error": str(e)}
+        
+        entries: Optional[Iterator[os.DirEntry]] = None
+        if trash_dir is not None and day is not None:
+            results, entries = self._discard_bucket(
+                subdir, cutoff_date.timestamp(), trash_dir, recorder
+            )
+            if results is not None:
+                return results
+        if entries is None:
+            entries = _walk_files(subdir)
+        return self._cleanup_entries(
+            subdir, entries, cutoff_date, dry_run, trash_dir, recorder
+        )
     
-    async def _get_cleanup_statistics(self) -> Dict[str, Any]:
-        """Get cleanup statistics."""
+    def _discard_bucket(
+        self,
+        subdir: str,
+        cutoff_ts: float,
+        trash_dir: Path,
+        recorder: _DeletedFilesRecorder,
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[Iterator[os.DirEntry]]]:
+        """
+        Rename a fully expired day directory into the trash in one operation.
+        
+        A subdirectory qualifies when its own mtime is older than the cutoff,
+        so no entry has been added or removed since then, and every file in
+        it is older than the cutoff as well. The mtime is checked again just
+        before the rename to catch a file arriving during the scan.
+        
+        Returns:
+            The cleanup results if the subdirectory was discarded (or None),
+            and the entries for the per-file fallback if it was only partly
+            scanned (or None)
+        """
+        scanned: List[os.DirEntry] = []
         try:
-            cutoff_date = datetime.now() - timedelta(days=self.settings.storage.retention_days)
-            
-            stats = {
-                "retention_days": self.settings.storage.retention_days,
-                "cutoff_date": cutoff_date,
-                "files_eligible_for_cleanup": 0,
-                "bytes_eligible_for_cleanup": 0,
-            }
-            
-            # Count eligible files
-            for directory in [self.settings.storage.video_directory, self.settings.storage.results_directory]:
-                if directory.exists():
-                    for file_path in directory.rglob("*"):
-                        if file_path.is_file():
-                            stat = file_path.stat()
-                            file_date = datetime.fromtimestamp(stat.st_mtime)
-                            
-                            if file_date < cutoff_date:
-                                stats["files_eligible_for_cleanup"] += 1
-                                stats["bytes_eligible_for_cleanup"] += stat.st_size
-            
-            return stats
-            
-        except Exception as e:
-            self.logger.error("Failed to get cleanup statistics", error=str(e))
-            return {"error": str(e)}
+            dir_mtime = os.lstat(subdir).st_mtime
+            if dir_mtime >= cutoff_ts:
+                return None, None
+            
+            walker = _walk_files(subdir)
+            total_size = 0
+            for entry in walker:
+                scanned.append(entry)
+                stat = entry.stat(follow_symlinks=False)
+                if stat.st_mtime >= cutoff_ts:
+                    # DirEntry caches its stat, so the fallback does not stat again
+                    return None, itertools.chain(scanned, walker)
+                total_size += stat.st_size
+            
+            if not scanned or os.lstat(subdir).st_mtime != dir_mtime:
+                return None, iter(scanned)
+            
+            os.rename(subdir, os.path.join(trash_dir, uuid.uuid4().hex))
+        except OSError:
+            return None, None
+        
+        recorder.add([entry.path for entry in scanned])
+        if self._debug_enabled:
+            self.logger.debug(
+                "Discarded expired directory", directory=subdir, files=len(scanned)
+            )
+        return {
+            "files_processed": len(scanned),
+            "files_deleted": len(scanned),
+            "bytes_freed": total_size,
+            "errors": [],
+        }, None
     
-    async def _cleanup_directory(self, directory: Path, cutoff_date: datetime, dry_run: bool) -> Dict[str, Any]:
-        """Clean up files in a specific directory."""
-        results = {
+    def _cleanup_entries(
+        self,
+        directory: str,
+        entries: Iterator[os.DirEntry],
+        cutoff_date: datetime,
+        dry_run: bool,
+        trash_dir: Optional[Path],
+        recorder: _DeletedFilesRecorder,
+    ) -> Dict[str, Any]:
+        """Delete (or, for a dry run, count) the entries older than cutoff_date."""
+        cutoff_ts = cutoff_date.timestamp()
+        results: Dict[str, Any] = {
             "files_processed": 0,
             "files_deleted": 0,
             "bytes_freed": 0,
             "errors": [],
-            "deleted_files": [],
         }
+        deleted: List[str] = []
         
         try:
-            for file_path in directory.rglob("*"):
-                if file_path.is_file():
-                    results["files_processed"] += 1
+            for entry in entries:
+                results["files_processed"] += 1
+                
+                try:
+                    stat = entry.stat(follow_symlinks=False)
                     
-                    try:
-                        stat = file_path.stat()
-                        file_date = datetime.fromtimestamp(stat.st_mtime)
+                    if stat.st_mtime < cutoff_ts:
+                        if dry_run:
+                            results["files_deleted"] += 1
+                            results["bytes_freed"] += stat.st_size
+                            deleted.append(entry.path)
+                        else:
+                            # Move the file to the trash; unlinking happens later
+                            self._discard_file(entry.path, trash_dir)
+                            results["files_deleted"] += 1
+                            results["bytes_freed"] += stat.st_size
+                            deleted.append(entry.path)
+                            
+                            if self._debug_enabled:
+                                self.logger.debug("Deleted old file", file=entry.path)
                         
-                        if file_date < cutoff_date:
-                            if dry_run:
-                                results["files_deleted"] += 1
-                                results["bytes_freed"] += stat.st_size
-                                results["deleted_files"].append(str(file_path))
-                            else:
-                                # Actually delete the file
-                                file_path.unlink()
-                                results["files_deleted"] += 1
-                                results["bytes_freed"] += stat.st_size
-                                results["deleted_files"].append(str(file_path))
-                                
-                                self.logger.debug("Deleted old file", file=str(file_path))
-                    
-                    except Exception as e:
-                        error_msg = f"Failed to process {file_path}: {str(e)}"
-                        results["errors"].append(error_msg)
-                        self.logger.error(error_msg)
-            
+                        if len(deleted) >= _DELETED_FILES_CHUNK:
+                            recorder.add(deleted)
+                            deleted = []
+                
+                except Exception as e:
+                    error_msg = f"Failed to process {entry.path}: {str(e)}"
+                    results["errors"].append(error_msg)
+                    self.logger.error(error_msg)
+            
+            if results["files_deleted"]:
+                self.logger.debug(
+                    "Cleaned up directory",
+                    directory=directory,
+                    files_deleted=results["files_deleted"],
+                    bytes_freed=results["bytes_freed"],
+                    dry_run=dry_run,
+                )
             return results
             
         except Exception as e:
             error_msg = f"Failed to cleanup directory {directory}: {str(e)}"
             results["errors"].append(error_msg)
             self.logger.error(error_msg)
-            return results 
\ No newline at end of file
+            return results
+        
+        finally:
+            recorder.add(deleted)
+    
+    @staticmethod
+    def _discard_file(path: str, trash_dir: Optional[Path]) -> None:
+        """Rename a file into trash_dir, or unlink it if it cannot be moved there."""
+        if trash_dir is not None:
+            try:
+                os.rename(path, os.path.join(trash_dir, uuid.uuid4().hex))
+                return
+            except OSError:
+                # e.g. the file sits on another mount below the storage root
+                pass
+        os.unlink(path)
+    
+    def _schedule_trash_purge(self) -> None:
+        """Start the background trash purge unless one is already running."""
+        if self._trash_dirs and (self._purge_task is None or self._purge_task.done()):
+            self._purge_task = asyncio.create_task(self._purge_trash())
+    
+    async def _purge_trash(self) -> None:
+        """Unlink everything in the known trash directories off the event loop."""
+        loop = asyncio.get_running_loop()
+        while self._trash_dirs:
+            trash_dir = self._trash_dirs.pop()
+            try:
+                await loop.run_in_executor(None, self._empty_trash_dir, trash_dir)
+            except Exception as e:
+                self.logger.error("Failed to empty trash", trash=str(trash_dir), error=str(e))
+    
+    @staticmethod
+    def _empty_trash_dir(trash_dir: Path) -> None:
+        """Remove every entry of a trash directory, keeping the directory."""
+        with os.scandir(trash_dir) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        shutil.rmtree(entry.path, ignore_errors=True)
+                    else:
+                        os.unlink(entry.path)
+                except FileNotFoundError:
+                    continue
+    
+    @staticmethod
+    def _merge_cleanup_results(total: Dict[str, Any], part: Dict[str, Any]) -> None:
+        """Add the counts and errors of one cleanup result into another."""
+        total["files_processed"] += part["files_processed"]
+        total["files_deleted"] += part["files_deleted"]
+        total["bytes_freed"] += part["bytes_freed"]
+        total["errors"].extend(part["errors"])
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Return the cleanup thread pool, creating it on first use."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=(os.cpu_count() or 1) * 2,
+                thread_name_prefix="storage-cleanup",
+            )
+        return self._executor
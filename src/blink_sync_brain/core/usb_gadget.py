@@ -7,16 +7,252 @@ to act as a virtual USB storage device for the Blink Sync Module.
 
 import asyncio
 import logging
-import subprocess
+import os
+import shutil
 import sys
+import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterator, List, Tuple
 
 import structlog
-import psutil
 
 from blink_sync_brain.config.settings import Settings
 
+# configfs attribute binding the gadget to a controller, and the controllers
+_GADGET_UDC_PATH = "/sys/kernel/config/usb_gadget/blink_storage/UDC"
+_UDC_CLASS_DIR = "/sys/class/udc"
+
+# Where an operator-managed mount of the virtual drive is expected
+_CLEANUP_MOUNT_POINT = Path("/mnt/blink_storage")
+
+# Seconds monitor_storage waits after an error, doubling up to the maximum
+_MONITOR_BACKOFF_MIN = 1.0
+_MONITOR_BACKOFF_MAX = 60.0
+
+# Touched after each successful apt-get update, which is skipped while the
+# stamp is younger than _APT_UPDATE_MAX_AGE seconds
+_APT_STAMP_PATH = "/var/lib/blink_sync_brain/apt_updated"
+_APT_UPDATE_MAX_AGE = 24 * 60 * 60
+
+# dd block size for zero-filling the virtual drive; SD card throughput
+# levels off well below this, and the buffer stays small
+_DD_BLOCK_SIZE_MB = 4
+
+
+@lru_cache(maxsize=1)
+def _detect_raspberry_pi() -> bool:
+    """
+    Check the board model once per process.
+    
+    /proc/device-tree/model is a short string such as "Raspberry Pi Zero 2
+    W"; /proc/cpuinfo is only read on kernels without a device tree.
+    """
+    for path in ("/proc/device-tree/model", "/proc/cpuinfo"):
+        try:
+            with open(path, "rb") as f:
+                return b"Raspberry Pi" in f.read()
+        except OSError:
+            continue
+    return False
+
+
+def _bind_udc() -> str:
+    """
+    Write the first USB device controller's name to the gadget's UDC file.
+    
+    Writing the name is what binds a configfs gadget; anything else, such
+    as "1", is rejected by the kernel.
+    
+    Returns:
+        Name of the controller the gadget was bound to
+    """
+    controllers = os.listdir(_UDC_CLASS_DIR)
+    if not controllers:
+        raise FileNotFoundError(f"No USB device controller in {_UDC_CLASS_DIR}")
+    udc_name = min(controllers)
+    with open(_GADGET_UDC_PATH, "w") as f:
+        f.write(udc_name)
+    return udc_name
+
+
+# configfs writes as (relative path, value or None for a directory), and
+# (function, config entry) symlinks to create after them
+_GadgetPlan = Tuple[List[Tuple[str, Optional[bytes]]], List[Tuple[str, str]]]
+
+
+def _gadget_write_plan(
+    config: Dict[str, Any], prefix: str = ""
+) -> List[Tuple[str, Optional[bytes]]]:
+    """
+    Flatten a gadget config into configfs writes, parents first.
+    
+    Returns:
+        (relative path, value) pairs; a value of None means a directory
+    """
+    plan: List[Tuple[str, Optional[bytes]]] = []
+    for key, value in config.items():
+        path = f"{prefix}{key}"
+        if isinstance(value, dict):
+            plan.append((path, None))
+            plan.extend(_gadget_write_plan(value, f"{path}/"))
+        else:
+            plan.append((path, str(value).encode()))
+    return plan
+
+
+def _write_gadget_config(
+    root: str,
+    plan: List[Tuple[str, Optional[bytes]]],
+    links: List[Tuple[str, str]],
+) -> None:
+    """Carry out a configfs write plan under root, then link the functions."""
+    for relpath, value in plan:
+        path = os.path.join(root, relpath)
+        if value is None:
+            # Some directories, e.g. lun.0, are created by the kernel
+            os.makedirs(path, exist_ok=True)
+            continue
+        fd = os.open(path, os.O_WRONLY)
+        try:
+            os.write(fd, value)
+        finally:
+            os.close(fd)
+    
+    for target, link in links:
+        link_path = os.path.join(root, link)
+        if not os.path.lexists(link_path):
+            os.symlink(os.path.join(root, target), link_path)
+
+
+def _drive_size(drive_path: Path) -> Optional[int]:
+    """Size of the virtual drive file in bytes, or None if it does not exist."""
+    try:
+        return os.stat(drive_path).st_size
+    except FileNotFoundError:
+        return None
+
+
+def _drive_free_bytes(drive_path: Path) -> int:
+    """Free space on the virtual drive's filesystem, or 0 if the drive is missing."""
+    if not drive_path.exists():
+        return 0
+    st = os.statvfs(drive_path.parent)
+    return st.f_bavail * st.f_frsize
+
+
+def _udc_bound() -> bool:
+    """Check whether the gadget's UDC attribute holds a controller name."""
+    try:
+        fd = os.open(_GADGET_UDC_PATH, os.O_RDONLY)
+    except FileNotFoundError:
+        return False
+    try:
+        # A controller name is a few bytes; no buffered text reader needed
+        return bool(os.read(fd, 64).strip())
+    finally:
+        os.close(fd)
+
+
+def _create_sparse_file(path: Path, size_bytes: int) -> None:
+    """
+    Create (or truncate) path as a sparse file of size_bytes.
+    
+    No blocks are allocated until they are written, so creation is
+    instant, but a write into a hole fails once the filesystem holding the
+    image is full; the preallocated default reserves the space up front.
+    """
+    fd = os.open(path, os.O_CREAT | os.O_WRONLY | os.O_TRUNC, 0o644)
+    try:
+        os.ftruncate(fd, size_bytes)
+    finally:
+        os.close(fd)
+
+
+def _apt_lists_stale() -> bool:
+    """Check whether our last successful apt-get update is over a day old."""
+    try:
+        return time.time() - os.stat(_APT_STAMP_PATH).st_mtime > _APT_UPDATE_MAX_AGE
+    except OSError:
+        return True
+
+
+def _touch_apt_stamp() -> None:
+    """Record a successful apt-get update; best effort."""
+    try:
+        os.makedirs(os.path.dirname(_APT_STAMP_PATH), exist_ok=True)
+        with open(_APT_STAMP_PATH, "wb"):
+            pass
+    except OSError:
+        pass
+
+
+def _fallocate(path: Path, size_bytes: int) -> None:
+    """Create (or truncate) path and preallocate size_bytes for it."""
+    fd = os.open(path, os.O_CREAT | os.O_WRONLY | os.O_TRUNC, 0o644)
+    try:
+        os.posix_fallocate(fd, 0, size_bytes)
+    finally:
+        os.close(fd)
+
+
+def _iter_files(directory: Path) -> Iterator[os.DirEntry]:
+    """Yield a DirEntry for every regular file under directory, skipping symlinks."""
+    pending = [os.fspath(directory)]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        yield entry
+        except PermissionError:
+            continue
+
+
+def _remove_files_older_than(directory: Path, cutoff_time: float) -> int:
+    """
+    Unlink every file under directory last modified before cutoff_time.
+    
+    scandir reports file types with the listing and DirEntry caches its
+    stat, so each file costs one lstat and one unlink.
+    
+    Returns:
+        Number of files removed
+    """
+    removed = 0
+    for entry in _iter_files(directory):
+        if entry.stat(follow_symlinks=False).st_mtime < cutoff_time:
+            os.unlink(entry.path)
+            removed += 1
+    return removed
+
+
+class _CommandResult:
+    """
+    Outcome of _run_command, shaped like subprocess.CompletedProcess.
+    
+    Output is kept as bytes and only decoded when stdout or stderr is read;
+    most callers only look at returncode.
+    """
+    
+    __slots__ = ("args", "returncode", "_stdout", "_stderr")
+    
+    def __init__(self, args: Any, returncode: int, stdout: bytes, stderr: bytes):
+        self.args = args
+        self.returncode = returncode
+        self._stdout = stdout
+        self._stderr = stderr
+    
+    @property
+    def stdout(self) -> str:
+        return self._stdout.decode(errors="replace")
+    
+    @property
+    def stderr(self) -> str:
+        return self._stderr.decode(errors="replace")
+
 
 class USBGadgetManager:
     """
@@ -31,8 +267,16 @@ class USBGadgetManager:
         self.settings = settings
         self.logger = structlog.get_logger()
         self.virtual_drive_path: Optional[Path] = None
+        # (virtual drive path, configfs plan) built by _get_gadget_plan
+        self._gadget_plan: Optional[Tuple[Optional[Path], _GadgetPlan]] = None
+        # Size of the image created by _create_virtual_drive; it never changes
+        self._drive_size_bytes: Optional[int] = None
         self.is_configured = False
         self.is_active = False
+        # Set by stop_usb_gadget() to end monitor_storage without waiting
+        self._stop_event: Optional[asyncio.Event] = None
+        # Path of mkfs.exfat, looked up on $PATH once
+        self._mkfs_exfat: Optional[str] = shutil.which("mkfs.exfat")
         
     async def setup_usb_gadget(self) -> bool:
         """
@@ -102,6 +346,9 @@ class USBGadgetManager:
         try:
             self.logger.info("Stopping USB gadget service")
             
+            if self._stop_event is not None:
+                self._stop_event.set()
+            
             # Stop the USB gadget service
             await self._stop_gadget_service()
             
@@ -120,13 +367,19 @@ class USBGadgetManager:
         Returns:
             Dict containing status information
         """
+        drive_size, free_space, connected = await asyncio.gather(
+            self._get_drive_size(),
+            self._get_free_space(),
+            self._is_connected(),
+        )
+        
         status = {
             "configured": self.is_configured,
             "active": self.is_active,
             "virtual_drive_path": str(self.virtual_drive_path) if self.virtual_drive_path else None,
-            "drive_size": await self._get_drive_size(),
-            "free_space": await self._get_free_space(),
-            "connected": await self._is_connected(),
+            "drive_size": drive_size,
+            "free_space": free_space,
+            "connected": connected,
         }
         
         return status
@@ -137,10 +390,14 @@ class USBGadgetManager:
         
         This method runs continuously to monitor the virtual drive
         and manage storage space by removing old files when needed.
+        It checks every monitor_interval seconds. After an error it retries
+        with exponential backoff; stop_usb_gadget() ends it at once.
         """
         self.logger.info("Starting storage monitoring")
+        stop_event = self._stop_event = asyncio.Event()
+        backoff = _MONITOR_BACKOFF_MIN
         
-        while self.is_active:
+        while self.is_active and not stop_event.is_set():
             try:
                 # Check available space
                 free_space = await self._get_free_space()
@@ -157,21 +414,28 @@ class USBGadgetManager:
                 if usage_percent > self.settings.storage.cleanup_threshold:
                     await self._cleanup_old_files()
                 
-                # Wait before next check
-                await asyncio.sleep(self.settings.storage.monitor_interval)
+                backoff = _MONITOR_BACKOFF_MIN
+                
+                # Wait for the next periodic check
+                await self._wait_for_stop(stop_event, self.settings.storage.monitor_interval)
                 
             except Exception as e:
-                self.logger.error("Error in storage monitoring", error=str(e))
-                await asyncio.sleep(60)  # Wait longer on error
+                self.logger.error(
+                    "Error in storage monitoring", error=str(e), retry_in=backoff
+                )
+                await self._wait_for_stop(stop_event, backoff)
+                backoff = min(backoff * 2, _MONITOR_BACKOFF_MAX)
+    
+    async def _wait_for_stop(self, stop_event: asyncio.Event, timeout: float) -> None:
+        """Wait up to timeout seconds, returning early once stop_event is set."""
+        try:
+            await asyncio.wait_for(stop_event.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
     
     def _is_raspberry_pi(self) -> bool:
         """Check if running on Raspberry Pi."""
-        try:
-            with open("/proc/cpuinfo", "r") as f:
-                cpu_info = f.read()
-                return "Raspberry Pi" in cpu_info
-        except Exception:
-            return False
+        return _detect_raspberry_pi()
     
     async def _create_virtual_drive(self) -> None:
         """Create the virtual drive file."""
@@ -183,23 +447,60 @@ class USBGadgetManager:
         # Create directory if it doesn't exist
         drive_path.parent.mkdir(parents=True, exist_ok=True)
         
-        # Create virtual drive file using dd
+        if self.settings.storage.zero_fill_virtual_drive:
+            await self._zero_fill_drive(drive_path, drive_size)
+        elif self.settings.storage.sparse_virtual_drive:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(
+                None, _create_sparse_file, drive_path, drive_size * 1024**3
+            )
+        else:
+            await self._allocate_drive(drive_path, drive_size)
+        
+        # Format the drive with ExFAT (recommended by Blink)
+        await self._format_drive(drive_path)
+        
+        self.virtual_drive_path = drive_path
+        self._drive_size_bytes = drive_path.stat().st_size
+        self.logger.info("Virtual drive created successfully")
+    
+    async def _allocate_drive(self, drive_path: Path, drive_size: int) -> None:
+        """
+        Reserve the blocks of the virtual drive file without writing them.
+        
+        Preallocated extents read back as zeros, so the image looks the same
+        to mkfs as a dd-written one, but creating it costs no SD card writes.
+        """
+        size_bytes = drive_size * 1024**3
+        loop = asyncio.get_running_loop()
+        try:
+            await loop.run_in_executor(None, _fallocate, drive_path, size_bytes)
+            return
+        except (AttributeError, OSError) as e:
+            # AttributeError: no os.posix_fallocate on this platform
+            self.logger.warning("posix_fallocate failed, trying fallocate", error=str(e))
+        
+        cmd = ["fallocate", "-l", f"{drive_size}G", str(drive_path)]
+        result = await self._run_command(cmd)
+        if result.returncode != 0:
+            raise RuntimeError(f"Failed to create virtual drive: {result.stderr}")
+    
+    async def _zero_fill_drive(self, drive_path: Path, drive_size: int) -> None:
+        """Create the virtual drive file by writing zeros with dd."""
+        # bs=1G made dd allocate a 1 GiB buffer, more than a Pi Zero 2 W has
         cmd = [
             "dd", "if=/dev/zero",
             f"of={drive_path}",
-            "bs=1G",
-            f"count={drive_size}",
+            f"bs={_DD_BLOCK_SIZE_MB}M",
+            f"count={drive_size * 1024 // _DD_BLOCK_SIZE_MB}",
+            "iflag=fullblock",
+            "conv=fsync",
+            "status=none",
         ]
         
         result = await self._run_command(cmd)
         if result.returncode != 0:
             raise RuntimeError(f"Failed to create virtual drive: {result.stderr}")
-        
-        # Format the drive with ExFAT (recommended by Blink)
-        await self._format_drive(drive_path)
-        
-        self.virtual_drive_path = drive_path
-        self.logger.info("Virtual drive created successfully")
     
     async def _format_drive(self, drive_path: Path) -> None:
         """Format the virtual drive with ExFAT filesystem."""
@@ -225,20 +526,24 @@ class USBGadgetManager:
         """Install exfat-utils package if not available."""
         try:
             # Check if exfat-utils is installed
-            result = await self._run_command(["which", "mkfs.exfat"])
-            if result.returncode == 0:
+            if self._mkfs_exfat is not None:
                 return  # Already installed
             
             # Install exfat-utils
             self.logger.info("Installing exfat-utils")
-            cmd = ["apt-get", "update"]
-            await self._run_command(cmd)
+            if _apt_lists_stale():
+                cmd = ["apt-get", "update"]
+                result = await self._run_command(cmd)
+                if result.returncode == 0:
+                    _touch_apt_stamp()
             
             cmd = ["apt-get", "install", "-y", "exfat-utils"]
             result = await self._run_command(cmd)
             
             if result.returncode != 0:
                 self.logger.warning("Failed to install exfat-utils", error=result.stderr)
+            
+            self._mkfs_exfat = shutil.which("mkfs.exfat")
                 
         except Exception as e:
             self.logger.warning("Could not install exfat-utils", error=str(e))
@@ -248,14 +553,14 @@ class USBGadgetManager:
         self.logger.info("Configuring USB gadget mode")
         
         # Create gadget configuration
-        config = self._create_gadget_config()
+        plan = self._get_gadget_plan()
         
         # Write configuration to file
         config_path = Path("/sys/kernel/config/usb_gadget/blink_storage")
         config_path.mkdir(parents=True, exist_ok=True)
         
         # Apply configuration
-        await self._apply_gadget_config(config_path, config)
+        await self._apply_gadget_config(config_path, plan)
         
         self.logger.info("USB gadget configuration applied")
     
@@ -287,74 +592,110 @@ class USBGadgetManager:
             "functions": {
                 "mass_storage.0": {
                     "lun.0": {
-                        "file": str(self.virtual_drive_path),
                         "removable": "1",
                         "cdrom": "0",
                         "ro": "0",
-                        "no_fua": "1"
+                        "no_fua": "1",
+                        # Last: LUN attributes are fixed once a file is attached
+                        "file": str(self.virtual_drive_path),
                     }
                 }
             }
         }
     
-    async def _apply_gadget_config(self, config_path: Path, config: Dict[str, Any]) -> None:
-        """Apply the gadget configuration."""
-        # This is a simplified version - in practice, you'd need to write
-        # the configuration to the appropriate sysfs files
-        self.logger.info("Applying gadget configuration", config_path=str(config_path))
+    def _get_gadget_plan(self) -> "_GadgetPlan":
+        """
+        Return the configfs writes and links for the gadget configuration.
+        
+        The nested config is flattened into (relative path, value) pairs,
+        nested dicts becoming configfs directories. The result only depends
+        on the virtual drive path, so it is built once and reused until that
+        path changes.
+        """
+        cached = self._gadget_plan
+        if cached is None or cached[0] != self.virtual_drive_path:
+            config = self._create_gadget_config()
+            links = [
+                (f"functions/{function}", f"configs/{configuration}/{function}")
+                for configuration in config.get("configs", {})
+                for function in config.get("functions", {})
+            ]
+            self._gadget_plan = (
+                self.virtual_drive_path,
+                (_gadget_write_plan(config), links),
+            )
+        return self._gadget_plan[1]
+    
+    async def _apply_gadget_config(self, config_path: Path, plan: "_GadgetPlan") -> None:
+        """
+        Apply the gadget configuration.
         
-        # Note: This is a placeholder for the actual implementation
-        # The real implementation would involve writing to sysfs files
-        # which requires root privileges and careful handling
+        Everything is written in one executor job; each attribute costs an
+        open, a write and a close. Requires root.
+        """
+        self.logger.info("Applying gadget configuration", config_path=str(config_path))
         
-        await asyncio.sleep(1)  # Simulate configuration time
+        writes, links = plan
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            None, _write_gadget_config, os.fspath(config_path), writes, links
+        )
     
     async def _enable_usb_gadget(self) -> None:
         """Enable USB gadget mode."""
         self.logger.info("Enabling USB gadget mode")
         
-        # Enable the gadget
-        cmd = ["echo", "1", ">", "/sys/kernel/config/usb_gadget/blink_storage/UDC"]
-        result = await self._run_command(cmd, shell=True)
+        # Enable the gadget by binding it to the device controller
+        loop = asyncio.get_running_loop()
+        try:
+            udc_name = await loop.run_in_executor(None, _bind_udc)
+        except OSError as e:
+            raise RuntimeError(f"Failed to enable USB gadget: {e}") from e
         
-        if result.returncode != 0:
-            raise RuntimeError(f"Failed to enable USB gadget: {result.stderr}")
+        self.logger.info("Bound USB gadget to controller", udc=udc_name)
         
         self.logger.info("USB gadget mode enabled")
     
     async def _start_gadget_service(self) -> None:
         """Start the USB gadget service."""
         # In a real implementation, this would start a systemd service
-        # or similar that manages the USB gadget
+        # or similar that manages the USB gadget; until then there is
+        # nothing to wait for
         self.logger.info("Starting USB gadget service")
-        await asyncio.sleep(1)  # Simulate service startup
     
     async def _stop_gadget_service(self) -> None:
         """Stop the USB gadget service."""
         self.logger.info("Stopping USB gadget service")
-        await asyncio.sleep(1)  # Simulate service shutdown
     
     async def _get_drive_size(self) -> int:
         """Get the total size of the virtual drive in bytes."""
-        if not self.virtual_drive_path or not self.virtual_drive_path.exists():
+        if self._drive_size_bytes is not None:
+            return self._drive_size_bytes
+        
+        if not self.virtual_drive_path:
             return 0
         
         try:
-            stat = self.virtual_drive_path.stat()
-            return stat.st_size
+            loop = asyncio.get_running_loop()
+            size = await loop.run_in_executor(None, _drive_size, self.virtual_drive_path)
+            if size is None:
+                return 0
+            self._drive_size_bytes = size
+            return size
         except Exception as e:
             self.logger.error("Failed to get drive size", error=str(e))
             return 0
     
     async def _get_free_space(self) -> int:
         """Get the free space on the virtual drive in bytes."""
-        if not self.virtual_drive_path or not self.virtual_drive_path.exists():
+        if not self.virtual_drive_path:
             return 0
         
         try:
-            # Get disk usage of the directory containing the virtual drive
-            disk_usage = psutil.disk_usage(self.virtual_drive_path.parent)
-            return disk_usage.free
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                None, _drive_free_bytes, self.virtual_drive_path
+            )
         except Exception as e:
             self.logger.error("Failed to get free space", error=str(e))
             return 0
@@ -362,53 +703,53 @@ class USBGadgetManager:
     async def _is_connected(self) -> bool:
         """Check if the USB gadget is connected to a host."""
         try:
-            # Check if the gadget is active in the system
-            udc_path = Path("/sys/kernel/config/usb_gadget/blink_storage/UDC")
-            if udc_path.exists():
-                with open(udc_path, "r") as f:
-                    content = f.read().strip()
-                    return bool(content)
-            return False
+            # The gadget is active when UDC names the controller it is bound to
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, _udc_bound)
         except Exception as e:
             self.logger.error("Failed to check connection status", error=str(e))
             return False
     
     async def _cleanup_old_files(self) -> None:
-        """Clean up old files to free up space."""
+        """
+        Clean up old files to free up space.
+        
+        Only sweeps a mount of the virtual drive that already exists; the
+        image is never mounted or taken from the Sync Module here, since a
+        second writer on a filesystem the module is using can corrupt it.
+        """
         self.logger.info("Cleaning up old files")
         
         try:
-            # Mount the virtual drive if not already mounted
-            mount_point = Path("/mnt/blink_storage")
-            mount_point.mkdir(exist_ok=True)
+            mount_point = _CLEANUP_MOUNT_POINT
+            if not os.path.ismount(mount_point):
+                self.logger.info(
+                    "Virtual drive is not mounted, skipping cleanup",
+                    mount_point=str(mount_point),
+                )
+                return
             
-            # Find and remove old files
-            cutoff_time = asyncio.get_event_loop().time() - self.settings.storage.retention_days * 86400
+            # Find and remove old files; st_mtime is wall-clock epoch time,
+            # unlike the loop's monotonic clock
+            cutoff_time = time.time() - self.settings.storage.retention_days * 86400
             
-            for file_path in mount_point.rglob("*"):
-                if file_path.is_file():
-                    if file_path.stat().st_mtime < cutoff_time:
-                        file_path.unlink()
-                        self.logger.debug("Removed old file", file=str(file_path))
+            loop = asyncio.get_running_loop()
+            removed = await loop.run_in_executor(
+                None, _remove_files_older_than, mount_point, cutoff_time
+            )
             
-            self.logger.info("Cleanup completed")
+            self.logger.info("Cleanup completed", files_removed=removed)
             
         except Exception as e:
             self.logger.error("Failed to cleanup old files", error=str(e))
     
-    async def _run_command(self, cmd: list, shell: bool = False) -> subprocess.CompletedProcess:
-        """Run a shell command asynchronously."""
-        if shell:
-            cmd = " ".join(cmd)
-        
+    async def _run_command(self, cmd: list) -> "_CommandResult":
+        """Run a command asynchronously, without a shell."""
         process = await asyncio.create_subprocess_exec(
-            *cmd if not shell else cmd,
+            *cmd,
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE,
-            shell=shell,
         )
         
         stdout, stderr = await process.communicate()
-        return subprocess.CompletedProcess(
-            cmd, process.returncode, stdout.decode(), stderr.decode()
-        ) 
\ No newline at end of file
+        return _CommandResult(cmd, process.returncode, stdout, stderr) 
\ No newline at end of file
@@ -8,21 +8,270 @@ Blink camera system enhancement.
 import asyncio
 import json
 import logging
+import os
+import queue
 import subprocess
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Callable, Dict, Generator, Iterator, List, Optional, Set, Tuple, TypeVar, Any
 
 import cv2
 import ffmpeg
 import numpy as np
 import structlog
-from moviepy.editor import VideoFileClip
+
+try:
+    import av
+except ImportError:
+    av = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # Linux only; other platforms fall back to polling the directory
+    from watchdog.observers.inotify import InotifyObserver
+except ImportError:
+    InotifyObserver = None
 
 from blink_sync_brain.core.face_recognition import FaceRecognitionEngine
+from blink_sync_brain.core.storage_manager import _TRASH_DIR_NAME
 from blink_sync_brain.models.video_metadata import VideoMetadata
 from blink_sync_brain.models.processing_result import ProcessingResult
 
+# File types picked up from the video directory
+_VIDEO_EXTENSIONS = frozenset({".mp4", ".avi", ".mov", ".mkv"})
+
+# Queued video paths remembered to avoid queueing a clip twice
+_QUEUED_VIDEOS_MAX = 1000
+
+# Seconds stop_processing waits for queued videos to finish
+_STOP_DRAIN_TIMEOUT = 30.0
+
+# Videos whose metadata is kept for reuse by later calls
+_METADATA_CACHE_SIZE = 1024
+
+# Decoded frames buffered ahead of face analysis
+_DECODE_QUEUE_DEPTH = 4
+
+# Motion is found on copies of the frame shrunk to at most this width
+_MOTION_WIDTH = 320
+# Foreground blobs smaller than this many motion-frame pixels are noise
+_MOTION_MIN_AREA = 16
+# Kept frames whose face boxes stay in the detection region, so faces that
+# stop moving are still followed
+_MOTION_FACE_HISTORY = 3
+# Pixels added around the detection region so faces on its edge are not cut
+_MOTION_MARGIN = 32
+
+# Matches paths inside a StorageManager trash directory
+_TRASH_PATH_PART = f"{os.sep}{_TRASH_DIR_NAME}{os.sep}"
+
+_T = TypeVar("_T")
+
+_Box = Tuple[int, int, int, int]
+
+
+def _iter_video_files(directory: str) -> Iterator[str]:
+    """Yield paths of video files under directory, recursively."""
+    pending = [directory]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    # Expired clips wait in the trash only to be deleted
+                    if entry.name != _TRASH_DIR_NAME:
+                        pending.append(entry.path)
+                elif os.path.splitext(entry.name)[1].lower() in _VIDEO_EXTENSIONS and entry.is_file():
+                    yield entry.path
+
+
+def _open_capture(video_path: Path, hardware_decode: bool) -> "cv2.VideoCapture":
+    """
+    Open a video, asking FFmpeg for hardware decoding when wanted.
+    
+    With VIDEO_ACCELERATION_ANY OpenCV picks whichever of VAAPI, V4L2 M2M,
+    D3D11 etc. works and quietly decodes in software when none does.
+    """
+    # Hardware acceleration properties were added in OpenCV 4.5.2
+    if hardware_decode and hasattr(cv2, "CAP_PROP_HW_ACCELERATION"):
+        cap = cv2.VideoCapture(
+            str(video_path),
+            cv2.CAP_FFMPEG,
+            [cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY],
+        )
+        if cap.isOpened():
+            return cap
+        cap.release()
+    return cv2.VideoCapture(str(video_path))
+
+
+def _iter_kept_frames(
+    cap: "cv2.VideoCapture", frame_skip: int, buffers: int
+) -> Iterator[Tuple[int, np.ndarray]]:
+    """
+    Yield (index, BGR frame) for every frame_skip-th frame of a capture.
+    
+    Frames are decoded into a ring of ``buffers`` arrays that are reused
+    once the ring wraps, so a frame is only valid until ``buffers - 1`` more
+    have been yielded.
+    """
+    ring: List[Optional[np.ndarray]] = [None] * buffers
+    slot = 0
+    frame_count = 0
+    # Skipped frames are only demuxed and decoded by grab(), not
+    # converted to BGR and copied out as retrieve() does
+    while cap.grab():
+        if frame_count % frame_skip == 0:
+            # retrieve() writes into the array passed in when it already
+            # has the frame's shape, and allocates one otherwise
+            ret, frame = cap.retrieve(ring[slot])
+            if not ret:
+                break
+            ring[slot] = frame
+            slot = (slot + 1) % buffers
+            yield frame_count, frame
+        frame_count += 1
+
+
+def _prefetch(items: Iterator[_T], depth: int) -> Generator[_T, None, None]:
+    """
+    Run an iterator on a background thread, keeping up to depth items ready.
+    
+    Exceptions raised by the iterator are re-raised in the consumer. Closing
+    the returned generator stops the thread and waits for it.
+    """
+    buffer: "queue.Queue[Tuple[Any, Optional[BaseException]]]" = queue.Queue(maxsize=depth)
+    done = object()
+    stop = threading.Event()
+    
+    def put(item: Any, error: Optional[BaseException] = None) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put((item, error), timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def produce() -> None:
+        try:
+            for item in items:
+                if not put(item):
+                    return
+        except BaseException as e:
+            put(done, e)
+        else:
+            put(done)
+    
+    thread = threading.Thread(target=produce, name="video-decode", daemon=True)
+    thread.start()
+    try:
+        while True:
+            item, error = buffer.get()
+            if item is done:
+                if error is not None:
+                    raise error
+                return
+            yield item
+    finally:
+        stop.set()
+        thread.join()
+
+
+class _VideoEventHandler:
+    """
+    watchdog event handler that queues finished video files.
+    
+    inotify reports IN_CLOSE_WRITE once a writer closes a file, so no size
+    polling is needed to tell that a clip is complete. Events arrive on the
+    observer thread and are handed to on_video on the event loop.
+    """
+    
+    __slots__ = ("_loop", "_on_video")
+    
+    def __init__(
+        self, loop: asyncio.AbstractEventLoop, on_video: Callable[[Path], None]
+    ) -> None:
+        self._loop = loop
+        self._on_video = on_video
+    
+    def dispatch(self, event: Any) -> None:
+        if event.is_directory:
+            return
+        if event.event_type == "closed":
+            path = event.src_path
+        elif event.event_type == "moved":
+            # Writers that rename a finished temporary file into place
+            path = event.dest_path
+        else:
+            return
+        
+        # StorageManager renames expired clips (and whole expired day
+        # directories) into the trash; those are being deleted, not added
+        if _TRASH_PATH_PART in path:
+            return
+        
+        if os.path.splitext(path)[1].lower() in _VIDEO_EXTENSIONS:
+            self._loop.call_soon_threadsafe(self._on_video, Path(path))
+
+
+class _MotionGate:
+    """
+    Limit face detection to the part of a frame that has changed.
+    
+    Blink cameras are fixed, so most frames of a clip are the empty scene.
+    A background subtractor finds the regions that moved; they are merged
+    with the faces found in the last few frames into one box to detect in.
+    """
+    
+    __slots__ = ("_subtractor", "_recent_faces")
+    
+    def __init__(self) -> None:
+        self._subtractor = cv2.createBackgroundSubtractorMOG2(
+            history=30, varThreshold=25, detectShadows=False
+        )
+        self._recent_faces: "deque[List[_Box]]" = deque(maxlen=_MOTION_FACE_HISTORY)
+    
+    def region(self, frame: np.ndarray) -> Optional[_Box]:
+        """Return the (top, right, bottom, left) box to detect in, or None."""
+        height, width = frame.shape[:2]
+        scale = min(1.0, _MOTION_WIDTH / width)
+        small = (
+            cv2.resize(frame, (0, 0), fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+            if scale < 1.0
+            else frame
+        )
+        mask = self._subtractor.apply(small)
+        # OpenCV 3 returns (image, contours, hierarchy), OpenCV 4 drops image
+        contours = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)[-2]
+        
+        boxes = [box for faces in self._recent_faces for box in faces]
+        for contour in contours:
+            x, y, w, h = cv2.boundingRect(contour)
+            if w * h >= _MOTION_MIN_AREA:
+                boxes.append(
+                    (int(y / scale), int((x + w) / scale), int((y + h) / scale), int(x / scale))
+                )
+        if not boxes:
+            return None
+        
+        return (
+            max(0, min(box[0] for box in boxes) - _MOTION_MARGIN),
+            min(width, max(box[1] for box in boxes) + _MOTION_MARGIN),
+            min(height, max(box[2] for box in boxes) + _MOTION_MARGIN),
+            max(0, min(box[3] for box in boxes) - _MOTION_MARGIN),
+        )
+    
+    def remember(self, face_locations: List[_Box]) -> None:
+        """Record the faces found in a kept frame."""
+        self._recent_faces.append(face_locations)
+
 
 class VideoProcessor:
     """
@@ -39,6 +288,10 @@ class VideoProcessor:
         self.face_engine: Optional[FaceRecognitionEngine] = None
         self.processing_queue: asyncio.Queue = asyncio.Queue()
         self.is_processing = False
+        # Decode and face analysis run here so they do not block the event loop
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # Least recently used last; keyed on (path, mtime_ns, size)
+        self._metadata_cache: "OrderedDict[Tuple[str, int, int], VideoMetadata]" = OrderedDict()
         
     async def start_processing(self, face_engine: FaceRecognitionEngine) -> None:
         """
@@ -65,9 +318,17 @@ class VideoProcessor:
         self.logger.info("Stopping video processing service")
         self.is_processing = False
         
-        # Wait for processing queue to empty
-        while not self.processing_queue.empty():
-            await asyncio.sleep(1)
+        # Wait for the processing loop to finish the videos already queued
+        try:
+            await asyncio.wait_for(self.processing_queue.join(), timeout=_STOP_DRAIN_TIMEOUT)
+        except asyncio.TimeoutError:
+            self.logger.warning(
+                "Stopped with videos still queued", pending=self.processing_queue.qsize()
+            )
+        
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
         
         self.logger.info("Video processing service stopped")
     
@@ -163,6 +424,9 @@ class VideoProcessor:
             # Use ffmpeg to concatenate videos
             cmd = [
                 "ffmpeg",
+                # Only errors reach stderr; progress lines would just be buffered
+                "-nostats",
+                "-loglevel", "error",
                 "-f", "concat",
                 "-safe", "0",
                 "-i", str(file_list_path),
@@ -225,7 +489,8 @@ class VideoProcessor:
         """Main processing loop for handling video files."""
         self.logger.info("Starting video processing loop")
         
-        while self.is_processing:
+        # Keep going after a stop until the queue is drained
+        while self.is_processing or not self.processing_queue.empty():
             try:
                 # Get next video from queue
                 try:
@@ -235,11 +500,12 @@ class VideoProcessor:
                 except asyncio.TimeoutError:
                     continue
                 
-                # Process the video
-                await self.process_video(video_path)
-                
-                # Mark task as done
-                self.processing_queue.task_done()
+                # Process the video, marking it done even if that fails so
+                # stop_processing's join() is not left waiting
+                try:
+                    await self.process_video(video_path)
+                finally:
+                    self.processing_queue.task_done()
                 
             except Exception as e:
                 self.logger.error("Error in processing loop", error=str(e))
@@ -253,6 +519,54 @@ class VideoProcessor:
         video_dir = Path(self.settings.storage.video_directory)
         video_dir.mkdir(parents=True, exist_ok=True)
         
+        if InotifyObserver is not None:
+            try:
+                await self._watch_video_directory(video_dir)
+                return
+            except OSError as e:
+                # e.g. fs.inotify.max_user_watches exhausted
+                self.logger.warning(
+                    "Could not watch video directory, polling instead", error=str(e)
+                )
+        
+        await self._poll_video_directory(video_dir)
+    
+    async def _watch_video_directory(self, video_dir: Path) -> None:
+        """Queue videos as inotify reports they were written or moved in."""
+        loop = asyncio.get_running_loop()
+        # Shared by the event handler and the startup scan; both run on the
+        # loop thread, so a clip closed during the scan is queued only once
+        queued: Set[Path] = set()
+        
+        def queue_video(video_file: Path) -> None:
+            if video_file in queued:
+                return
+            if len(queued) > _QUEUED_VIDEOS_MAX:
+                queued.clear()
+            queued.add(video_file)
+            self.processing_queue.put_nowait(video_file)
+            self.logger.info("Queued video for processing", video=str(video_file))
+        
+        observer = InotifyObserver()
+        observer.schedule(
+            _VideoEventHandler(loop, queue_video), str(video_dir), recursive=True
+        )
+        observer.start()
+        
+        self.logger.info("Watching video directory", directory=str(video_dir))
+        
+        try:
+            # Clips written before the watch started produce no events
+            await self._queue_new_videos(video_dir, queued)
+            
+            while self.is_processing:
+                await asyncio.sleep(1)
+        finally:
+            observer.stop()
+            await loop.run_in_executor(None, observer.join)
+    
+    async def _poll_video_directory(self, video_dir: Path) -> None:
+        """Rescan the video directory every monitor_interval seconds."""
         self.logger.info("Monitoring video directory", directory=str(video_dir))
         
         # Track processed files
@@ -260,26 +574,10 @@ class VideoProcessor:
         
         while self.is_processing:
             try:
-                # Find new video files
-                video_extensions = {".mp4", ".avi", ".mov", ".mkv"}
-                
-                for video_file in video_dir.rglob("*"):
-                    if (
-                        video_file.is_file()
-                        and video_file.suffix.lower() in video_extensions
-                        and video_file not in processed_files
-                    ):
-                        # Check if file is complete (not being written)
-                        if await self._is_file_complete(video_file):
-                            await self.processing_queue.put(video_file)
-                            processed_files.add(video_file)
-                            
-                            self.logger.info(
-                                "Queued video for processing", video=str(video_file)
-                            )
+                await self._queue_new_videos(video_dir, processed_files)
                 
                 # Clean up old processed files from memory
-                if len(processed_files) > 1000:
+                if len(processed_files) > _QUEUED_VIDEOS_MAX:
                     processed_files.clear()
                 
                 await asyncio.sleep(self.settings.processing.monitor_interval)
@@ -288,9 +586,50 @@ class VideoProcessor:
                 self.logger.error("Error in video monitoring", error=str(e))
                 await asyncio.sleep(30)  # Wait longer on error
     
+    async def _queue_new_videos(self, video_dir: Path, processed_files: set) -> None:
+        """Queue complete video files under video_dir not in processed_files."""
+        for video_path in _iter_video_files(str(video_dir)):
+            video_file = Path(video_path)
+            if video_file not in processed_files:
+                # Check if file is complete (not being written); it may have
+                # been queued by someone else during the wait
+                if (
+                    await self._is_file_complete(video_file)
+                    and video_file not in processed_files
+                ):
+                    await self.processing_queue.put(video_file)
+                    processed_files.add(video_file)
+                    
+                    self.logger.info(
+                        "Queued video for processing", video=str(video_file)
+                    )
+    
     async def _extract_metadata(self, video_path: Path) -> VideoMetadata:
-        """Extract metadata from video file."""
+        """Extract metadata from video file, reusing earlier results."""
+        # A rewritten file gets a new mtime or size, and so a new key
+        stat = video_path.stat()
+        key = (str(video_path), stat.st_mtime_ns, stat.st_size)
+        metadata = self._metadata_cache.get(key)
+        if metadata is not None:
+            self._metadata_cache.move_to_end(key)
+            return metadata
+        
+        metadata = await self._probe_metadata(video_path)
+        self._metadata_cache[key] = metadata
+        if len(self._metadata_cache) > _METADATA_CACHE_SIZE:
+            self._metadata_cache.popitem(last=False)
+        return metadata
+    
+    async def _probe_metadata(self, video_path: Path) -> VideoMetadata:
+        """Read metadata from a video file with PyAV or ffprobe."""
         try:
+            if av is not None:
+                # Read the container in-process instead of spawning ffprobe
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(
+                    self._get_executor(), self._probe_with_av, video_path
+                )
+            
             # Use ffprobe to get video information
             cmd = [
                 "ffprobe",
@@ -318,17 +657,20 @@ class VideoProcessor:
             if not video_stream:
                 raise RuntimeError("No video stream found")
             
-            # Get file creation time
-            created = datetime.fromtimestamp(video_path.stat().st_ctime)
+            # ffprobe reports frame rates as a fraction such as "30000/1001"
+            num, _, den = video_stream["r_frame_rate"].partition("/")
+            den = float(den or 1)
+            
+            stat = video_path.stat()
             
             metadata = VideoMetadata(
                 width=int(video_stream["width"]),
                 height=int(video_stream["height"]),
-                fps=float(eval(video_stream["r_frame_rate"])),
+                fps=float(num) / den if den else 0.0,
                 duration=float(data["format"]["duration"]),
                 codec=video_stream["codec_name"],
-                created=created,
-                file_size=video_path.stat().st_size,
+                created=datetime.fromtimestamp(stat.st_ctime),
+                file_size=stat.st_size,
             )
             
             return metadata
@@ -337,55 +679,137 @@ class VideoProcessor:
             self.logger.error("Failed to extract metadata", error=str(e))
             raise
     
+    @staticmethod
+    def _probe_with_av(video_path: Path) -> VideoMetadata:
+        """Read video metadata with PyAV, matching what ffprobe reports."""
+        with av.open(str(video_path)) as container:
+            if not container.streams.video:
+                raise RuntimeError("No video stream found")
+            stream = container.streams.video[0]
+            
+            rate = stream.average_rate or stream.base_rate
+            if container.duration is not None:
+                duration = container.duration / av.time_base
+            elif stream.duration is not None and stream.time_base is not None:
+                duration = float(stream.duration * stream.time_base)
+            else:
+                duration = 0.0
+            
+            stat = video_path.stat()
+            
+            return VideoMetadata(
+                width=stream.codec_context.width,
+                height=stream.codec_context.height,
+                fps=float(rate) if rate else 0.0,
+                duration=float(duration),
+                codec=stream.codec_context.name,
+                created=datetime.fromtimestamp(stat.st_ctime),
+                file_size=stat.st_size,
+            )
+    
     async def _analyze_faces(self, video_path: Path) -> Dict[str, Any]:
-        """Analyze faces in video file."""
+        """Analyze faces in video file on the worker pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_executor(), self._analyze_faces_sync, video_path
+        )
+    
+    def _analyze_faces_sync(self, video_path: Path) -> Dict[str, Any]:
+        """Decode a video and run face detection and recognition on it."""
         start_time = datetime.now()
         
         try:
             # Open video file
-            cap = cv2.VideoCapture(str(video_path))
+            cap = _open_capture(video_path, self.settings.processing.hardware_decode)
             
             if not cap.isOpened():
                 raise RuntimeError("Could not open video file")
             
             detections = []
             recognized_faces = []
-            frame_count = 0
-            
-            while True:
-                ret, frame = cap.read()
-                if not ret:
-                    break
-                
-                # Process every nth frame for performance
-                if frame_count % self.settings.processing.frame_skip == 0:
-                    # Detect faces in frame
-                    face_locations = self.face_engine.detect_faces(frame)
+            fps = cap.get(cv2.CAP_PROP_FPS)
+            # Some containers report no frame rate; their timestamps stay 0
+            seconds_per_frame = 1.0 / fps if fps > 0 else 0.0
+            
+            # Encodings wait here to be recognized in batches, with their detections
+            batch_size = max(1, self.settings.processing.recognition_batch_size)
+            pending: List[Tuple[Dict[str, Any], np.ndarray]] = []
+            
+            def recognize_pending() -> None:
+                names = self.face_engine.recognize_faces([encoding for _, encoding in pending])
+                for (detection, _), name in zip(pending, names):
+                    detection["name"] = name
+                    if name and name != "Unknown":
+                        recognized_faces.append(detection)
+                pending.clear()
+            
+            # The background model is per video, as each clip may be a new camera
+            gate = _MotionGate() if self.settings.processing.motion_gate else None
+            
+            # Bound once; the loop below runs for every kept frame
+            convert_frame = self.face_engine.convert_frame
+            detect_faces = self.face_engine.detect_faces
+            get_face_encodings = self.face_engine.get_face_encodings
+            
+            # Frames are decoded on a background thread while faces are
+            # analysed here; OpenCV releases the GIL while it decodes
+            frames = _prefetch(
+                # Queued frames, the one being analysed and the one being
+                # decoded each need their own buffer
+                _iter_kept_frames(
+                    cap, self.settings.processing.frame_skip, _DECODE_QUEUE_DEPTH + 2
+                ),
+                _DECODE_QUEUE_DEPTH,
+            )
+            try:
+                for frame_count, frame in frames:
+                    region: Optional[_Box] = None
+                    if gate is not None:
+                        region = gate.region(frame)
+                        if region is None:
+                            # Nothing moved and no faces were seen recently
+                            gate.remember([])
+                            continue
+                    
+                    # OpenCV decodes to BGR; face_recognition expects RGB
+                    rgb_frame = convert_frame(frame)
+                    
+                    # Detect faces in frame, or only in the changed region
+                    if gate is None or region is None:
+                        face_locations = detect_faces(rgb_frame)
+                    else:
+                        top, right, bottom, left = region
+                        face_locations = [
+                            (t + top, r + left, b + top, l + left)
+                            for t, r, b, l in detect_faces(
+                                np.ascontiguousarray(rgb_frame[top:bottom, left:right])
+                            )
+                        ]
+                        gate.remember(face_locations)
+                    
+                    # Encode every face in the frame with one call
+                    face_encodings = get_face_encodings(rgb_frame, face_locations)
                     
-                    for face_location in face_locations:
-                        # Extract face encoding
-                        face_encoding = self.face_engine.get_face_encoding(frame, face_location)
+                    for face_location, face_encoding in zip(face_locations, face_encodings):
+                        detection = {
+                            "frame": frame_count,
+                            "timestamp": frame_count * seconds_per_frame,
+                            "location": face_location,
+                            "name": None,  # Set by recognize_pending
+                            "confidence": 0.8,  # Placeholder
+                        }
                         
-                        if face_encoding is not None:
-                            # Recognize face
-                            name = self.face_engine.recognize_face(face_encoding)
-                            
-                            detection = {
-                                "frame": frame_count,
-                                "timestamp": frame_count / cap.get(cv2.CAP_PROP_FPS),
-                                "location": face_location,
-                                "name": name,
-                                "confidence": 0.8,  # Placeholder
-                            }
-                            
-                            detections.append(detection)
-                            
-                            if name and name != "Unknown":
-                                recognized_faces.append(detection)
+                        detections.append(detection)
+                        pending.append((detection, face_encoding))
+                        if len(pending) >= batch_size:
+                            recognize_pending()
                 
-                frame_count += 1
-            
-            cap.release()
+                if pending:
+                    recognize_pending()
+            finally:
+                # Stops and joins the decoder before the capture goes away
+                frames.close()
+                cap.release()
             
             processing_time = (datetime.now() - start_time).total_seconds()
             
@@ -401,21 +825,9 @@ class VideoProcessor:
     
     async def _sort_videos_by_time(self, video_paths: List[Path]) -> List[Path]:
         """Sort video files by creation time."""
-        video_times = []
-        
-        for video_path in video_paths:
-            try:
-                metadata = await self._extract_metadata(video_path)
-                video_times.append((video_path, metadata.created))
-            except Exception as e:
-                self.logger.warning("Could not get metadata for video", video=str(video_path))
-                # Use file modification time as fallback
-                video_times.append((video_path, datetime.fromtimestamp(video_path.stat().st_mtime)))
-        
-        # Sort by creation time
-        video_times.sort(key=lambda x: x[1])
-        
-        return [video_path for video_path, _ in video_times]
+        # VideoMetadata.created is the file's ctime, so read it with one
+        # stat() per file rather than running ffprobe on every clip
+        return sorted(video_paths, key=lambda video_path: video_path.stat().st_ctime)
     
     async def _is_file_complete(self, file_path: Path) -> bool:
         """Check if file is complete (not being written)."""
@@ -436,16 +848,41 @@ class VideoProcessor:
     
     async def _save_results(self, result: ProcessingResult, output_dir: Path) -> None:
         """Save processing results to file."""
-        output_dir.mkdir(parents=True, exist_ok=True)
-        
         # Save results as JSON
         results_file = output_dir / f"{result.video_path.stem}_results.json"
         
-        with open(results_file, "w") as f:
-            json.dump(result.to_dict(), f, indent=2, default=str)
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            self._get_executor(), self._write_results, result, results_file
+        )
         
         self.logger.info("Results saved", file=str(results_file))
     
+    @staticmethod
+    def _write_results(result: ProcessingResult, results_file: Path) -> None:
+        """Serialize a processing result to a JSON file."""
+        results_file.parent.mkdir(parents=True, exist_ok=True)
+        if orjson is not None:
+            data = orjson.dumps(
+                result.to_dict(),
+                default=str,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY,
+            )
+            with open(results_file, "wb") as f:
+                f.write(data)
+        else:
+            with open(results_file, "w") as f:
+                json.dump(result.to_dict(), f, indent=2, default=str)
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Return the processing thread pool, creating it on first use."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=os.cpu_count() or 1,
+                thread_name_prefix="video-processing",
+            )
+        return self._executor
+    
     async def _run_command(self, cmd: List[str]) -> subprocess.CompletedProcess:
         """Run a shell command asynchronously."""
         process = await asyncio.create_subprocess_exec(
@@ -5,14 +5,38 @@ This module defines the data structures for face recognition
 and face database management.
 """
 
-from dataclasses import dataclass
+from __future__ import annotations
+
+import base64
+import time
+from dataclasses import MISSING, dataclass, field, fields
 from datetime import datetime
-from typing import Optional
+from typing import Any, Optional
+
+from blink_sync_brain._compat import DATACLASS_OPTIONS
+
+# Part of the processor extra; annotations are lazy, so only encoding
+# conversion needs it
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def _encoding_to_b64(encoding: np.ndarray) -> str:
+    """Pack an encoding's float32 bytes as base64 text."""
+    return base64.b64encode(np.ascontiguousarray(encoding, dtype=np.float32).tobytes()).decode("ascii")
 
-import numpy as np
 
+def _encoding_from_dict(data: dict) -> np.ndarray:
+    """Read an encoding written by to_dict, or as a list by older versions."""
+    if "encoding_b64" in data:
+        # frombuffer views the immutable bytes read-only; copy to own the data
+        return np.frombuffer(base64.b64decode(data["encoding_b64"]), dtype=np.float32).copy()
+    return np.array(data["encoding"])
 
-@dataclass
+
+@dataclass(**DATACLASS_OPTIONS)
 class FaceData:
     """Basic face data structure."""
     
@@ -24,7 +48,8 @@ class FaceData:
     def to_dict(self) -> dict:
         """Convert to dictionary."""
         return {
-            "encoding": self.encoding.tolist(),
+            "encoding_b64": _encoding_to_b64(self.encoding),
+            "encoding_dim": self.encoding.shape[0],
             "location": self.location,
             "confidence": self.confidence,
             "timestamp": self.timestamp.isoformat(),
@@ -34,74 +59,155 @@ class FaceData:
     def from_dict(cls, data: dict) -> "FaceData":
         """Create from dictionary."""
         return cls(
-            encoding=np.array(data["encoding"]),
+            encoding=_encoding_from_dict(data),
             location=tuple(data["location"]),
             confidence=data["confidence"],
             timestamp=datetime.fromisoformat(data["timestamp"]),
         )
 
 
-@dataclass
+@dataclass(init=False, **DATACLASS_OPTIONS)
 class KnownFace:
-    """Known face information for the database."""
+    """
+    Known face information for the database.
+    
+    Times are stored as Unix seconds; added_date and last_seen are still
+    accepted by the constructor and readable as datetimes.
+    """
     
     name: str
     encoding: np.ndarray
     description: str = ""
     confidence_threshold: float = 0.6
-    added_date: Optional[datetime] = None
+    added_ts: float = field(default_factory=time.time)  # Unix seconds
     image_path: Optional[str] = None
-    last_seen: Optional[datetime] = None
+    last_seen_ts: Optional[float] = None  # Unix seconds
     detection_count: int = 0
     
-    def __post_init__(self):
-        """Post-initialization setup."""
-        if self.added_date is None:
-            self.added_date = datetime.now()
+    def __init__(
+        self,
+        name: str,
+        encoding: np.ndarray,
+        description: str = "",
+        confidence_threshold: float = 0.6,
+        added_ts: Optional[float] = None,
+        image_path: Optional[str] = None,
+        last_seen_ts: Optional[float] = None,
+        detection_count: int = 0,
+        *,
+        added_date: Optional[datetime] = None,
+        last_seen: Optional[datetime] = None,
+    ) -> None:
+        """Initialize a known face, converting datetimes given the old way."""
+        if added_ts is None:
+            added_ts = added_date.timestamp() if added_date is not None else time.time()
+        if last_seen_ts is None and last_seen is not None:
+            last_seen_ts = last_seen.timestamp()
+        
+        self.name = name
+        self.encoding = encoding
+        self.description = description
+        self.confidence_threshold = confidence_threshold
+        self.added_ts = added_ts
+        self.image_path = image_path
+        self.last_seen_ts = last_seen_ts
+        self.detection_count = detection_count
     
-    def to_dict(self) -> dict:
-        """Convert to dictionary."""
-        return {
+    @property
+    def added_date(self) -> datetime:
+        """When the face was added, as a local datetime."""
+        return datetime.fromtimestamp(self.added_ts)
+    
+    @property
+    def last_seen(self) -> Optional[datetime]:
+        """When the face was last detected, as a local datetime."""
+        if self.last_seen_ts is None:
+            return None
+        return datetime.fromtimestamp(self.last_seen_ts)
+    
+    def __setstate__(self, state: Any) -> None:
+        """Restore pickled instances, upgrading those from older versions."""
+        if isinstance(state, tuple):
+            # (__dict__, slot values), as pickled from a slotted instance
+            dict_state, slot_state = state
+            state = {**(dict_state or {}), **(slot_state or {})}
+        
+        if "added_date" in state:
+            state = dict(state)
+            added_date = state.pop("added_date")
+            state["added_ts"] = added_date.timestamp() if added_date else time.time()
+        if "last_seen" in state:
+            state = dict(state)
+            last_seen = state.pop("last_seen")
+            state["last_seen_ts"] = last_seen.timestamp() if last_seen else None
+        
+        # Slotted instances have no class-level defaults to fall back on
+        for f in fields(self):
+            if f.name in state:
+                value = state[f.name]
+            elif f.default is not MISSING:
+                value = f.default
+            elif f.default_factory is not MISSING:
+                value = f.default_factory()
+            else:
+                continue
+            object.__setattr__(self, f.name, value)
+    
+    def to_dict(self, include_encoding: bool = True) -> dict:
+        """Convert to dictionary, optionally leaving out the encoding."""
+        data = {
             "name": self.name,
-            "encoding": self.encoding.tolist(),
             "description": self.description,
             "confidence_threshold": self.confidence_threshold,
-            "added_date": self.added_date.isoformat() if self.added_date else None,
+            "added_ts": self.added_ts,
             "image_path": self.image_path,
-            "last_seen": self.last_seen.isoformat() if self.last_seen else None,
+            "last_seen_ts": self.last_seen_ts,
             "detection_count": self.detection_count,
         }
+        if include_encoding:
+            data["encoding_b64"] = _encoding_to_b64(self.encoding)
+            data["encoding_dim"] = self.encoding.shape[0]
+        return data
     
     @classmethod
-    def from_dict(cls, data: dict) -> "KnownFace":
-        """Create from dictionary."""
+    def from_dict(cls, data: dict, encoding: Optional[np.ndarray] = None) -> "KnownFace":
+        """Create from dictionary, taking the encoding from data unless given."""
+        if "added_ts" in data:
+            added_ts = data["added_ts"]
+        elif data.get("added_date"):
+            added_ts = datetime.fromisoformat(data["added_date"]).timestamp()
+        else:
+            added_ts = time.time()
+        
+        if "last_seen_ts" in data:
+            last_seen_ts = data["last_seen_ts"]
+        elif data.get("last_seen"):
+            last_seen_ts = datetime.fromisoformat(data["last_seen"]).timestamp()
+        else:
+            last_seen_ts = None
+        
         return cls(
             name=data["name"],
-            encoding=np.array(data["encoding"]),
+            encoding=encoding if encoding is not None else _encoding_from_dict(data),
             description=data.get("description", ""),
             confidence_threshold=data.get("confidence_threshold", 0.6),
-            added_date=datetime.fromisoformat(data["added_date"]) if data.get("added_date") else None,
+            added_ts=added_ts,
             image_path=data.get("image_path"),
-            last_seen=datetime.fromisoformat(data["last_seen"]) if data.get("last_seen") else None,
+            last_seen_ts=last_seen_ts,
             detection_count=data.get("detection_count", 0),
         )
     
-    def update_detection(self, timestamp: datetime = None) -> None:
+    def update_detection(self, timestamp: Optional[datetime] = None) -> None:
         """Update detection information."""
-        if timestamp is None:
-            timestamp = datetime.now()
-        
-        self.last_seen = timestamp
+        self.last_seen_ts = time.time() if timestamp is None else timestamp.timestamp()
         self.detection_count += 1
     
-    def get_age_days(self) -> float:
-        """Get the age of this face record in days."""
-        if self.added_date:
-            return (datetime.now() - self.added_date).days
-        return 0.0
+    def get_age_days(self) -> int:
+        """Get the age of this face record in whole days."""
+        return int((time.time() - self.added_ts) // 86400)
     
-    def get_days_since_last_seen(self) -> Optional[float]:
-        """Get days since last detection."""
-        if self.last_seen:
-            return (datetime.now() - self.last_seen).days
+    def get_days_since_last_seen(self) -> Optional[int]:
+        """Get whole days since last detection."""
+        if self.last_seen_ts is not None:
+            return int((time.time() - self.last_seen_ts) // 86400)
         return None 
\ No newline at end of file
@@ -10,10 +10,12 @@ from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 
+from blink_sync_brain._compat import DATACLASS_OPTIONS
+
 from .video_metadata import VideoMetadata
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class ProcessingResult:
     """Video processing result information."""
     
@@ -66,13 +68,8 @@ class ProcessingResult:
         }
     
     def get_recognized_names(self) -> List[str]:
-        """Get list of recognized face names."""
-        names = []
-        for face in self.recognized_faces:
-            name = face.get("name")
-            if name and name not in names:
-                names.append(name)
-        return names
+        """Get list of recognized face names, in order of first recognition."""
+        return list(dict.fromkeys(face["name"] for face in self.recognized_faces if face.get("name")))
     
     def has_unknown_faces(self) -> bool:
         """Check if there are any unknown faces detected."""
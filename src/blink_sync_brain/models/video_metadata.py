@@ -9,8 +9,10 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 
+from blink_sync_brain._compat import DATACLASS_OPTIONS
 
-@dataclass
+
+@dataclass(**DATACLASS_OPTIONS)
 class VideoMetadata:
     """Video metadata information."""
     
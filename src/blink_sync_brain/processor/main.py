@@ -1,13 +1,14 @@
 #!/usr/bin/env python3
 import argparse
 import asyncio
+import sys
 from pathlib import Path
 
-import structlog
-
 from blink_sync_brain.config.settings import Settings
-from blink_sync_brain.processor.face_recognition import FaceRecognitionEngine
-from blink_sync_brain.processor.video_processor import VideoProcessor
+
+# The face engine and video processor pull in OpenCV, dlib and numpy, so they
+# are imported only by the commands that use them; `status` and `--help`
+# start without them
 
 
 def parse_args() -> argparse.Namespace:
@@ -15,8 +16,13 @@ def parse_args() -> argparse.Namespace:
     sub = parser.add_subparsers(dest="command")
 
     proc = sub.add_parser("process-video", help="Process a single video file")
-    proc.add_argument("video_path", type=Path)
+    proc.add_argument("video_path", type=Path, nargs="?")
     proc.add_argument("--output-dir", type=Path)
+    proc.add_argument(
+        "--batch-stdin",
+        action="store_true",
+        help="Process the video paths read from stdin, one per line, loading faces once",
+    )
     proc.add_argument("--config", type=Path)
 
     start = sub.add_parser("start", help="Start background processing (watch directory)")
@@ -28,6 +34,11 @@ def parse_args() -> argparse.Namespace:
 
 
 async def _start_processing(settings: Settings) -> int:
+    import structlog
+
+    from blink_sync_brain.processor.face_recognition import FaceRecognitionEngine
+    from blink_sync_brain.processor.video_processor import VideoProcessor
+
     logger = structlog.get_logger()
     face = FaceRecognitionEngine(settings)
     await face.load_face_database()
@@ -44,14 +55,36 @@ async def _start_processing(settings: Settings) -> int:
 
 async def _run() -> int:
     args = parse_args()
-    settings = Settings(config_path=args.config) if getattr(args, "config", None) else Settings()
+    settings = Settings.get_instance(getattr(args, "config", None))
 
     if args.command == "process-video":
+        from blink_sync_brain.processor.face_recognition import FaceRecognitionEngine
+        from blink_sync_brain.processor.video_processor import VideoProcessor
+
+        if (args.video_path is None) == (not args.batch_stdin):
+            print("process-video needs either a video path or --batch-stdin")
+            return 2
+
         face = FaceRecognitionEngine(settings)
         await face.load_face_database()
         processor = VideoProcessor(settings)
-        await processor.process_video(args.video_path, args.output_dir, face)
-        return 0
+
+        if not args.batch_stdin:
+            await processor.process_video(args.video_path, args.output_dir, face)
+            return 0
+
+        # One loaded database serves the whole batch; process_video logs
+        # each failure, so carry on and report it in the exit status
+        failed = 0
+        for line in sys.stdin:
+            video_path = line.strip()
+            if not video_path:
+                continue
+            try:
+                await processor.process_video(Path(video_path), args.output_dir, face)
+            except Exception:
+                failed += 1
+        return 1 if failed else 0
 
     if args.command == "start":
         return await _start_processing(settings)